@@ -35,7 +35,27 @@ class MplCanvas(FigureCanvas):
         super().__init__(self.fig)
 
 
-class QuantumWellVisualizer(QMainWindow):
+class LazyToolbarMixin:
+    """
+    延迟创建导航工具栏
+    
+    NavigationToolbar会注册matplotlib回调并加载整套图标，
+    这里推迟到窗口首次显示（showEvent）时才创建，
+    未显示的窗口不会占用这部分资源。
+    
+    使用方需在init_ui中设置 self.canvas 和 self.plot_layout。
+    """
+    
+    toolbar = None
+    
+    def showEvent(self, event):
+        if self.toolbar is None:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            self.plot_layout.insertWidget(0, self.toolbar)
+        super().showEvent(event)
+
+
+class QuantumWellVisualizer(LazyToolbarMixin, QMainWindow):
     """
     量子力学：无限深势阱波函数可视化
     
@@ -60,15 +80,13 @@ class QuantumWellVisualizer(QMainWindow):
         main_layout.addWidget(self.create_control_panel(), stretch=0)
         
         # 右侧：图形
-        plot_layout = QVBoxLayout()
+        self.plot_layout = QVBoxLayout()
         
+        # 工具栏在showEvent中延迟创建
         self.canvas = MplCanvas(self, width=8, height=6, dpi=100)
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.canvas)
+        self.plot_layout.addWidget(self.canvas)
         
-        main_layout.addLayout(plot_layout, stretch=1)
+        main_layout.addLayout(self.plot_layout, stretch=1)
         
         # 样式
         self.setStyleSheet("""
@@ -243,7 +261,7 @@ class QuantumWellVisualizer(QMainWindow):
         self.canvas.draw()
 
 
-class DampedOscillatorVisualizer(QMainWindow):
+class DampedOscillatorVisualizer(LazyToolbarMixin, QMainWindow):
     """
     电磁学/力学：阻尼振荡可视化
     """
@@ -329,12 +347,10 @@ class DampedOscillatorVisualizer(QMainWindow):
         main_layout.addWidget(panel)
         
         # 图形
-        plot_layout = QVBoxLayout()
+        self.plot_layout = QVBoxLayout()
         self.canvas = MplCanvas(self, width=8, height=6, dpi=100)
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.canvas)
-        main_layout.addLayout(plot_layout, stretch=1)
+        self.plot_layout.addWidget(self.canvas)
+        main_layout.addLayout(self.plot_layout, stretch=1)
         
         self.setStyleSheet("""
             QMainWindow { background-color: #f5f6fa; }
@@ -416,7 +432,7 @@ class DampedOscillatorVisualizer(QMainWindow):
         self.canvas.draw()
 
 
-class MaxwellBoltzmannVisualizer(QMainWindow):
+class MaxwellBoltzmannVisualizer(LazyToolbarMixin, QMainWindow):
     """
     热力学：麦克斯韦-玻尔兹曼速度分布
     """
@@ -510,12 +526,10 @@ class MaxwellBoltzmannVisualizer(QMainWindow):
         main_layout.addWidget(panel)
         
         # 图形
-        plot_layout = QVBoxLayout()
+        self.plot_layout = QVBoxLayout()
         self.canvas = MplCanvas(self, width=8, height=6, dpi=100)
-        self.toolbar = NavigationToolbar(self.canvas, self)
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.canvas)
-        main_layout.addLayout(plot_layout, stretch=1)
+        self.plot_layout.addWidget(self.canvas)
+        main_layout.addLayout(self.plot_layout, stretch=1)
         
         self.setStyleSheet("""
             QMainWindow { background-color: #f5f6fa; }
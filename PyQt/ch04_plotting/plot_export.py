@@ -6,7 +6,7 @@
     演示图表的导出和保存功能：
     - 多格式导出（PNG, PDF, SVG, EPS）
     - DPI和尺寸设置
-    - 数据导出为CSV
+    - 数据导出为CSV / Parquet / Feather
     - 批量导出
 
 运行方式：
@@ -15,20 +15,163 @@
 
 import sys
 import os
+import pickle
 import numpy as np
-from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox, QDoubleSpinBox, QComboBox,
     QGroupBox, QFormLayout, QFileDialog, QLineEdit, QCheckBox,
     QMessageBox, QProgressBar
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
+try:
+    import blosc2
+    BLOSC2_AVAILABLE = True
+except ImportError:
+    BLOSC2_AVAILABLE = False
+
+try:
+    import mplcairo
+    MPLCAIRO_AVAILABLE = True
+except ImportError:
+    MPLCAIRO_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# 矢量格式：安装了mplcairo时改用其Cairo后端导出，通常更快、文件更小
+VECTOR_FORMATS = ('pdf', 'svg', 'eps')
+
+
+def export_backend(ext: str):
+    """返回导出该格式使用的后端（None表示Matplotlib默认后端）"""
+    if MPLCAIRO_AVAILABLE and ext in VECTOR_FORMATS:
+        return 'module://mplcairo.base'
+    return None
+
+
+def measure_tight_bbox(fig: Figure, pad_inches: float = 0.1):
+    """
+    计算图形的紧凑边界框（英寸）
+    
+    bbox_inches='tight' 会在每次savefig时先完整渲染一遍来测量边界；
+    这里只测量一次，把得到的Bbox直接传给savefig。
+    """
+    canvas = fig.canvas
+    if not hasattr(canvas, 'get_renderer'):
+        # 反序列化得到的图形没有可用的渲染器，挂一个离屏Agg画布
+        canvas = FigureCanvasAgg(fig)
+    return fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+
+
+# 数据文件写缓冲区大小（1 MB），减少write系统调用次数
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_csv(filename: str, data: np.ndarray, header: str, fmt: str = '%.18e'):
+    """
+    将二维数组写入CSV文件
+    
+    安装了pyarrow时由其C++多线程CSV写入器完成（此时忽略fmt，
+    浮点数以最短精确形式输出）；否则np.savetxt逐行执行
+    fmt % tuple(row)的方式太慢，这里把整张表的格式串拼好后
+    只做一次格式化，再一次性写入文件。
+    """
+    if PYARROW_AVAILABLE:
+        # 表头自行写入（pyarrow默认会给列名加引号），数据按列构建Arrow表
+        table = pa.table({name: np.ascontiguousarray(column)
+                          for name, column in zip(header.split(','), data.T)})
+        with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write((header + '\n').encode())
+            pa_csv.write_csv(table, f,
+                             write_options=pa_csv.WriteOptions(include_header=False))
+        return
+    
+    n_rows, n_cols = data.shape
+    row_fmt = ','.join([fmt] * n_cols) + '\n'
+    text = (row_fmt * n_rows) % tuple(data.ravel())
+    
+    with open(filename, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(header + '\n')
+        f.write(text)
+
+
+# 数据表格式：名称 -> (扩展名, 文件过滤器)
+# Parquet/Feather为二进制列式存储，省去浮点数到文本的转换，需要pyarrow
+TABLE_FORMATS = {
+    "Parquet": ("parquet", "Parquet文件 (*.parquet)"),
+    "Feather": ("feather", "Feather文件 (*.feather)"),
+    "CSV": ("csv", "CSV文件 (*.csv)"),
+}
+
+
+def write_table(filename: str, data: np.ndarray, header: str, ext: str = 'csv'):
+    """按扩展名将二维数组写为CSV、Parquet或Feather文件"""
+    if ext == 'csv':
+        write_csv(filename, data, header)
+        return
+    
+    table = pa.table({name: np.ascontiguousarray(column)
+                      for name, column in zip(header.split(','), data.T)})
+    if ext == 'parquet':
+        pa_parquet.write_table(table, filename, compression='zstd',
+                               compression_level=1)
+    elif ext == 'feather':
+        pa_feather.write_feather(table, filename, compression='lz4')
+    else:
+        raise ValueError(f"不支持的数据格式: {ext}")
+
+
+# 示例曲线：(数据键, 线型, 图例标签)
+CURVES = (
+    ('sin', 'b-', r'$\sin(x)$'),
+    ('cos', 'r--', r'$\cos(x)$'),
+    ('exp', 'g-.', r'$e^{-x/5}$'),
+)
+
+
+class ExportWorker(QThread):
+    """
+    导出工作线程
+    
+    savefig在高DPI或矢量格式下可能耗时数秒，放到后台执行，
+    避免界面冻结。每个任务为 (文件名, 保存函数)。
+    """
+    
+    progress = pyqtSignal(int, str)   # 进度(百分比, 文件名)
+    result = pyqtSignal(list)         # 已保存的文件列表
+    error = pyqtSignal(str)           # 错误
+    
+    def __init__(self, jobs: list):
+        super().__init__()
+        self.jobs = jobs
+    
+    def run(self):
+        """依次执行导出任务"""
+        saved = []
+        try:
+            for i, (filename, save_func) in enumerate(self.jobs):
+                save_func(filename)
+                saved.append(filename)
+                progress = int((i + 1) / len(self.jobs) * 100)
+                self.progress.emit(progress, os.path.basename(filename))
+            self.result.emit(saved)
+        except Exception as e:
+            self.error.emit(str(e))
+
 
 class MplCanvas(FigureCanvas):
     """Matplotlib画布"""
@@ -46,10 +189,25 @@ class PlotExportDemo(QMainWindow):
         super().__init__()
         
         # 存储绘图数据
-        self.x_data = None
+        self.x_data = np.linspace(0, 10, 100)
         self.y_data = None
         
+        # 预分配三条曲线的数据（每行一条：sin, cos, exp）
+        self._sample = np.empty((3, self.x_data.size))
+        self._noise_scale = np.array([[0.1], [0.1], [0.05]])
+        
+        # 随机数生成器只创建一次，每次生成数据时直接抽样
+        self.rng = np.random.default_rng()
+        
+        # 紧凑边界框缓存：(尺寸, 坐标范围, 留白) -> Bbox
+        self._tight_bbox_key = None
+        self._tight_bbox = None
+        
+        # 后台导出线程
+        self.export_worker = None
+        
         self.init_ui()
+        self.setup_plot()
         self.generate_sample_plot()
     
     def init_ui(self):
@@ -78,6 +236,11 @@ class PlotExportDemo(QMainWindow):
         self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
         plot_layout.addWidget(self.label_status)
         
+        # 导出进度
+        self.progress_export = QProgressBar()
+        self.progress_export.setVisible(False)
+        plot_layout.addWidget(self.progress_export)
+        
         main_layout.addLayout(plot_layout, stretch=1)
         
         self.setStyleSheet("""
@@ -152,8 +315,9 @@ class PlotExportDemo(QMainWindow):
         self.check_transparent = QCheckBox("透明背景")
         image_form.addRow("", self.check_transparent)
         
+        # 裁剪空白需要额外测量一次边界，默认关闭
         self.check_tight = QCheckBox("裁剪空白")
-        self.check_tight.setChecked(True)
+        self.check_tight.setChecked(False)
         image_form.addRow("", self.check_tight)
         
         image_group.setLayout(image_form)
@@ -169,10 +333,26 @@ class PlotExportDemo(QMainWindow):
         data_group = QGroupBox("数据导出")
         data_layout = QVBoxLayout()
         
-        btn_save_csv = QPushButton("📊 导出为 CSV")
-        btn_save_csv.setStyleSheet("background-color: #27ae60;")
-        btn_save_csv.clicked.connect(self.save_csv)
-        data_layout.addWidget(btn_save_csv)
+        # 数据表格式（安装pyarrow时默认Parquet，CSV用于通用交换）
+        self.combo_table_format = QComboBox()
+        if PYARROW_AVAILABLE:
+            self.combo_table_format.addItems(list(TABLE_FORMATS))
+        else:
+            self.combo_table_format.addItem("CSV")
+        data_layout.addWidget(self.combo_table_format)
+        
+        btn_save_table = QPushButton("📊 导出数据表")
+        btn_save_table.setStyleSheet("background-color: #27ae60;")
+        btn_save_table.clicked.connect(self.save_table)
+        data_layout.addWidget(btn_save_table)
+        
+        # NumPy导出格式：np.savez本身不压缩（最快）；
+        # savez_compressed用DEFLATE压缩，文件小但慢；Blosc2（LZ4）兼顾二者
+        self.combo_numpy_format = QComboBox()
+        self.combo_numpy_format.addItems(["NPZ（不压缩）", "NPZ（压缩）"])
+        if BLOSC2_AVAILABLE:
+            self.combo_numpy_format.addItem("Blosc2（LZ4）")
+        data_layout.addWidget(self.combo_numpy_format)
         
         btn_save_numpy = QPushButton("🔢 导出为 NumPy")
         btn_save_numpy.setStyleSheet("background-color: #9b59b6;")
@@ -208,34 +388,46 @@ class PlotExportDemo(QMainWindow):
         
         return panel
     
+    def setup_plot(self):
+        """
+        创建曲线、坐标轴标签和图例（只执行一次）
+        
+        图例中的数学公式标签由mathtext解析排版；
+        重新生成数据时只替换曲线数据，标签和图例保持不变。
+        """
+        axes = self.canvas.axes
+        
+        self.lines = {}
+        for key, style, label in CURVES:
+            self.lines[key], = axes.plot(self.x_data, np.zeros_like(self.x_data),
+                                         style, linewidth=1.5, label=label)
+        
+        axes.set_xlabel('x', fontsize=12)
+        axes.set_ylabel('y', fontsize=12)
+        axes.set_title('示例图形 - 可导出为多种格式', fontsize=14)
+        axes.legend(loc='upper right')
+        axes.grid(True, alpha=0.3)
+    
     def generate_sample_plot(self):
         """生成示例图形"""
         # 生成数据
-        np.random.seed(int(datetime.now().timestamp()) % 1000)
-        
-        self.x_data = np.linspace(0, 10, 100)
-        
-        # 多条曲线
-        self.y_data = {}
-        self.y_data['sin'] = np.sin(self.x_data) + np.random.randn(100) * 0.1
-        self.y_data['cos'] = np.cos(self.x_data) + np.random.randn(100) * 0.1
-        self.y_data['exp'] = np.exp(-self.x_data / 5) + np.random.randn(100) * 0.05
+        # 多条曲线：直接写入预分配数组，噪声一次生成
+        sample = self._sample
+        np.sin(self.x_data, out=sample[0])
+        np.cos(self.x_data, out=sample[1])
+        np.multiply(self.x_data, -1 / 5, out=sample[2])
+        np.exp(sample[2], out=sample[2])
+        sample += self.rng.standard_normal(sample.shape) * self._noise_scale
         
-        # 绘图
-        self.canvas.axes.clear()
+        self.y_data = {'sin': sample[0], 'cos': sample[1], 'exp': sample[2]}
         
-        self.canvas.axes.plot(self.x_data, self.y_data['sin'], 'b-', 
-                               linewidth=1.5, label=r'$\sin(x)$')
-        self.canvas.axes.plot(self.x_data, self.y_data['cos'], 'r--', 
-                               linewidth=1.5, label=r'$\cos(x)$')
-        self.canvas.axes.plot(self.x_data, self.y_data['exp'], 'g-.', 
-                               linewidth=1.5, label=r'$e^{-x/5}$')
+        # 更新曲线数据（图形内容变化，边界框缓存失效）
+        self._tight_bbox_key = None
+        for key, line in self.lines.items():
+            line.set_ydata(self.y_data[key])
         
-        self.canvas.axes.set_xlabel('x', fontsize=12)
-        self.canvas.axes.set_ylabel('y', fontsize=12)
-        self.canvas.axes.set_title('示例图形 - 可导出为多种格式', fontsize=14)
-        self.canvas.axes.legend(loc='upper right')
-        self.canvas.axes.grid(True, alpha=0.3)
+        self.canvas.axes.relim()
+        self.canvas.axes.autoscale_view()
         
         self.canvas.fig.tight_layout()
         self.canvas.draw()
@@ -243,6 +435,56 @@ class PlotExportDemo(QMainWindow):
         self.label_status.setText("已生成新的示例数据")
         self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
     
+    def tight_bbox(self, pad_inches: float = 0.1):
+        """界面图形的紧凑边界框（尺寸和坐标范围不变时复用缓存）"""
+        axes = self.canvas.axes
+        key = (tuple(self.canvas.fig.get_size_inches()),
+               axes.get_xlim(), axes.get_ylim(), pad_inches)
+        if key != self._tight_bbox_key:
+            self._tight_bbox = measure_tight_bbox(self.canvas.fig, pad_inches)
+            self._tight_bbox_key = key
+        return self._tight_bbox
+    
+    def clone_figure(self) -> Figure:
+        """复制当前图形，供后台线程导出（不触碰界面上的图形）"""
+        return pickle.loads(pickle.dumps(self.canvas.fig))
+    
+    def start_export(self, jobs: list, on_result) -> bool:
+        """在后台线程中执行导出任务"""
+        if self.export_worker is not None:
+            QMessageBox.warning(self, "警告", "正在导出，请稍候")
+            return False
+        
+        self.progress_export.setValue(0)
+        self.progress_export.setVisible(True)
+        self.label_status.setText("正在导出...")
+        self.label_status.setStyleSheet("color: #3498db; padding: 5px;")
+        
+        self.export_worker = ExportWorker(jobs)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.result.connect(on_result)
+        self.export_worker.error.connect(self.on_export_error)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.start()
+        return True
+    
+    def on_export_progress(self, value: int, name: str):
+        """导出进度更新"""
+        self.progress_export.setValue(value)
+        self.label_status.setText(f"已保存: {name}")
+    
+    def on_export_error(self, message: str):
+        """导出出错"""
+        self.label_status.setText(f"✗ 保存失败: {message}")
+        self.label_status.setStyleSheet("color: #e74c3c; padding: 5px;")
+        QMessageBox.critical(self, "错误", f"保存失败:\n{message}")
+    
+    def on_export_finished(self):
+        """导出线程结束"""
+        self.progress_export.setVisible(False)
+        self.export_worker.wait()
+        self.export_worker = None
+    
     def save_image(self):
         """保存图片"""
         # 获取格式
@@ -276,57 +518,63 @@ class PlotExportDemo(QMainWindow):
         tight = self.check_tight.isChecked()
         
         try:
-            # 临时调整图形大小
-            original_size = self.canvas.fig.get_size_inches()
-            self.canvas.fig.set_size_inches(width, height)
-            
-            # 保存
-            save_kwargs = {
-                'dpi': dpi,
-                'transparent': transparent,
-                'facecolor': self.canvas.fig.get_facecolor() if not transparent else 'none',
-            }
-            
-            if tight:
-                save_kwargs['bbox_inches'] = 'tight'
-                save_kwargs['pad_inches'] = 0.1
-            
-            self.canvas.fig.savefig(filename, **save_kwargs)
-            
-            # 恢复原始大小
-            self.canvas.fig.set_size_inches(original_size)
-            self.canvas.draw()
-            
-            self.label_status.setText(f"✓ 已保存: {os.path.basename(filename)}")
-            self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
-            
-            # 显示文件信息
-            file_size = os.path.getsize(filename) / 1024
-            QMessageBox.information(
-                self, "保存成功",
-                f"文件已保存:\n{filename}\n\n"
-                f"格式: {fmt_name}\n"
-                f"分辨率: {dpi} dpi\n"
-                f"尺寸: {width}\" × {height}\"\n"
-                f"文件大小: {file_size:.1f} KB"
-            )
-            
+            # 在离屏副本上调整尺寸，界面上的图形保持不变，无需重绘
+            export_fig = self.clone_figure()
+            export_fig.set_size_inches(width, height)
         except Exception as e:
-            self.label_status.setText(f"✗ 保存失败: {str(e)}")
-            self.label_status.setStyleSheet("color: #e74c3c; padding: 5px;")
-            QMessageBox.critical(self, "错误", f"保存失败:\n{str(e)}")
+            self.on_export_error(str(e))
+            return
+        
+        # 保存参数
+        save_kwargs = {
+            'dpi': dpi,
+            'transparent': transparent,
+            'facecolor': export_fig.get_facecolor() if not transparent else 'none',
+            'backend': export_backend(fmt_ext),
+        }
+        
+        def save(f):
+            # 紧凑边界框在后台线程中按导出尺寸测量
+            if tight:
+                save_kwargs['bbox_inches'] = measure_tight_bbox(export_fig, 0.1)
+            export_fig.savefig(f, **save_kwargs)
+        
+        self.start_export(
+            [(filename, save)],
+            lambda files: self.on_image_saved(files[0], fmt_name, dpi, width, height)
+        )
+    
+    def on_image_saved(self, filename: str, fmt_name: str, dpi: int,
+                       width: float, height: float):
+        """图片保存完成"""
+        self.label_status.setText(f"✓ 已保存: {os.path.basename(filename)}")
+        self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
+        
+        # 显示文件信息
+        file_size = os.path.getsize(filename) / 1024
+        QMessageBox.information(
+            self, "保存成功",
+            f"文件已保存:\n{filename}\n\n"
+            f"格式: {fmt_name}\n"
+            f"分辨率: {dpi} dpi\n"
+            f"尺寸: {width}\" × {height}\"\n"
+            f"文件大小: {file_size:.1f} KB"
+        )
     
-    def save_csv(self):
-        """保存为CSV"""
-        if self.x_data is None:
+    def save_table(self):
+        """保存为数据表（CSV / Parquet / Feather）"""
+        if self.y_data is None:
             QMessageBox.warning(self, "警告", "没有数据可导出")
             return
         
+        fmt_name = self.combo_table_format.currentText()
+        fmt_ext, fmt_filter = TABLE_FORMATS[fmt_name]
+        
         filename, _ = QFileDialog.getSaveFileName(
             self,
-            "导出CSV",
-            "data.csv",
-            "CSV文件 (*.csv)"
+            f"导出{fmt_name}",
+            f"data.{fmt_ext}",
+            fmt_filter
         )
         
         if not filename:
@@ -343,14 +591,14 @@ class PlotExportDemo(QMainWindow):
             
             # 保存
             header = "x,sin(x),cos(x),exp(-x/5)"
-            np.savetxt(filename, data, delimiter=',', header=header, comments='')
+            write_table(filename, data, header, fmt_ext)
             
             self.label_status.setText(f"✓ 数据已导出: {os.path.basename(filename)}")
             self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
             
             QMessageBox.information(
                 self, "导出成功",
-                f"数据已导出为CSV:\n{filename}\n\n"
+                f"数据已导出为{fmt_name}:\n{filename}\n\n"
                 f"数据点数: {len(self.x_data)}\n"
                 f"列: x, sin(x), cos(x), exp(-x/5)"
             )
@@ -360,39 +608,67 @@ class PlotExportDemo(QMainWindow):
     
     def save_numpy(self):
         """保存为NumPy格式"""
-        if self.x_data is None:
+        if self.y_data is None:
             QMessageBox.warning(self, "警告", "没有数据可导出")
             return
         
+        fmt_index = self.combo_numpy_format.currentIndex()
+        use_blosc2 = fmt_index == 2
+        
+        if use_blosc2:
+            default_name, file_filter = "data.b2frame", "Blosc2文件 (*.b2frame)"
+        else:
+            default_name, file_filter = "data.npz", "NumPy文件 (*.npz)"
+        
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "导出NumPy",
-            "data.npz",
-            "NumPy文件 (*.npz)"
+            default_name,
+            file_filter
         )
         
         if not filename:
             return
         
         try:
-            np.savez(
-                filename,
-                x=self.x_data,
-                sin=self.y_data['sin'],
-                cos=self.y_data['cos'],
-                exp=self.y_data['exp']
-            )
+            arrays = {
+                'x': self.x_data,
+                'sin': self.y_data['sin'],
+                'cos': self.y_data['cos'],
+                'exp': self.y_data['exp'],
+            }
+            
+            if use_blosc2:
+                # 按列堆叠为一个二维数组，LZ4 + shuffle压缩
+                data = np.column_stack(list(arrays.values()))
+                blosc2.save_array(
+                    data, filename, mode='w',
+                    cparams={'codec': blosc2.Codec.LZ4, 'clevel': 1,
+                             'filters': [blosc2.Filter.SHUFFLE]}
+                )
+                load_hint = (
+                    f"data = blosc2.load_array('{os.path.basename(filename)}')\n"
+                    f"x, y = data[:, 0], data[:, 1]"
+                )
+            else:
+                if fmt_index == 1:
+                    np.savez_compressed(filename, **arrays)
+                else:
+                    np.savez(filename, **arrays)
+                load_hint = (
+                    f"data = np.load('{os.path.basename(filename)}')\n"
+                    f"x = data['x']\n"
+                    f"y = data['sin']"
+                )
             
             self.label_status.setText(f"✓ 数据已导出: {os.path.basename(filename)}")
             self.label_status.setStyleSheet("color: #9b59b6; padding: 5px;")
             
             QMessageBox.information(
                 self, "导出成功",
-                f"数据已导出为NumPy格式:\n{filename}\n\n"
+                f"数据已导出为{self.combo_numpy_format.currentText()}格式:\n{filename}\n\n"
                 f"加载方式:\n"
-                f"data = np.load('{os.path.basename(filename)}')\n"
-                f"x = data['x']\n"
-                f"y = data['sin']"
+                f"{load_hint}"
             )
             
         except Exception as e:
@@ -412,45 +688,48 @@ class PlotExportDemo(QMainWindow):
         dpi = self.spin_dpi.value()
         
         formats = ['png', 'pdf', 'svg']
-        success_count = 0
         
         try:
-            for fmt in formats:
-                filename = os.path.join(folder, f"{prefix}.{fmt}")
-                self.canvas.fig.savefig(
-                    filename,
-                    dpi=dpi,
-                    bbox_inches='tight',
-                    pad_inches=0.1
-                )
-                success_count += 1
+            # 各格式共用同一个边界框，只测量一次
+            bbox = self.tight_bbox(0.1)
+            export_fig = self.clone_figure()
             
-            # 同时导出CSV
-            csv_file = os.path.join(folder, f"{prefix}_data.csv")
             data = np.column_stack([
                 self.x_data,
                 self.y_data['sin'],
                 self.y_data['cos'],
                 self.y_data['exp']
             ])
-            np.savetxt(csv_file, data, delimiter=',', 
-                       header="x,sin,cos,exp", comments='')
-            
-            self.label_status.setText(f"✓ 批量导出完成: {success_count + 1} 个文件")
-            self.label_status.setStyleSheet("color: #e67e22; padding: 5px;")
-            
-            QMessageBox.information(
-                self, "批量导出完成",
-                f"已导出到: {folder}\n\n"
-                f"文件列表:\n"
-                f"  • {prefix}.png\n"
-                f"  • {prefix}.pdf\n"
-                f"  • {prefix}.svg\n"
-                f"  • {prefix}_data.csv"
-            )
-            
         except Exception as e:
             QMessageBox.critical(self, "错误", f"批量导出失败:\n{str(e)}")
+            return
+        
+        jobs = [
+            (os.path.join(folder, f"{prefix}.{fmt}"),
+             lambda f, backend=export_backend(fmt):
+                 export_fig.savefig(f, dpi=dpi, bbox_inches=bbox, backend=backend))
+            for fmt in formats
+        ]
+        
+        # 同时导出数据表
+        table_ext = TABLE_FORMATS[self.combo_table_format.currentText()][0]
+        jobs.append((os.path.join(folder, f"{prefix}_data.{table_ext}"),
+                     lambda f: write_table(f, data, "x,sin,cos,exp", table_ext)))
+        
+        self.start_export(jobs, lambda files: self.on_batch_exported(folder, files))
+    
+    def on_batch_exported(self, folder: str, files: list):
+        """批量导出完成"""
+        self.label_status.setText(f"✓ 批量导出完成: {len(files)} 个文件")
+        self.label_status.setStyleSheet("color: #e67e22; padding: 5px;")
+        
+        file_list = "\n".join(f"  • {os.path.basename(f)}" for f in files)
+        QMessageBox.information(
+            self, "批量导出完成",
+            f"已导出到: {folder}\n\n"
+            f"文件列表:\n"
+            f"{file_list}"
+        )
 
 
 def main():
@@ -468,6 +747,7 @@ def main():
     print("  - SVG: 矢量格式，适合网页和编辑")
     print("  - EPS: 矢量格式，适合LaTeX文档")
     print("\n数据导出:")
+    print("  - Parquet/Feather: 列式二进制格式（需要pyarrow）")
     print("  - CSV: 通用表格格式")
     print("  - NPZ: NumPy压缩格式")
     print("=" * 50)
@@ -16,7 +16,6 @@ import sys
 import time
 import random
 import numpy as np
-from collections import deque
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSpinBox, QDoubleSpinBox, QGroupBox, QFormLayout,
@@ -28,6 +27,19 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+
+def limits_changed(old, new, tolerance=0.02) -> bool:
+    """判断坐标范围的变化是否超过当前范围的一定比例"""
+    span = (old[1] - old[0]) or 1.0
+    return (abs(new[0] - old[0]) > tolerance * span
+            or abs(new[1] - old[1]) > tolerance * span)
+
 
 class RealtimePlotCanvas(FigureCanvas):
     """实时绑图画布"""
@@ -46,19 +58,34 @@ class RealtimePlotWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # 数据缓冲区
+        # 数据缓冲区（预分配的NumPy环形缓冲区）
         self.max_points = 200
-        self.time_data = deque(maxlen=self.max_points)
-        self.value_data = deque(maxlen=self.max_points)
+        self.time_buf = np.empty(self.max_points)
+        self.value_buf = np.empty(self.max_points)
+        self.head = 0     # 下一个写入位置
+        self.filled = 0   # 已写入的点数
+        
+        # 数值范围随写入增量维护；旧的极值被覆盖时才整体重算
+        self.v_min = np.inf
+        self.v_max = -np.inf
+        self.v_range_stale = False
         
         # 时间计数
         self.start_time = time.time()
+        self.last_time = 0.0
         self.data_count = 0
         
         # 信号参数
         self.frequency = 1.0
         self.amplitude = 1.0
         self.noise_level = 0.1
+        self.rng = np.random.default_rng()
+        
+        # 波形函数表，顺序与波形下拉框一致；切换时缓存当前函数
+        self.signal_funcs = [
+            self.sine_wave, self.square_wave, self.triangle_wave, self.random_walk
+        ]
+        self.signal_func = self.sine_wave
         
         self.init_ui()
         self.setup_plot()
@@ -177,6 +204,7 @@ class RealtimePlotWindow(QMainWindow):
         
         self.combo_signal = QComboBox()
         self.combo_signal.addItems(["正弦波", "方波", "三角波", "随机游走"])
+        self.combo_signal.currentIndexChanged.connect(self.on_signal_changed)
         form.addRow("波形:", self.combo_signal)
         
         signal_group.setLayout(form)
@@ -192,12 +220,18 @@ class RealtimePlotWindow(QMainWindow):
         self.spin_points.valueChanged.connect(self.on_max_points_changed)
         display_form.addRow("显示点数:", self.spin_points)
         
+        # 采样与绘图解耦，采样间隔可低至1ms
         self.spin_interval = QSpinBox()
-        self.spin_interval.setRange(10, 500)
+        self.spin_interval.setRange(1, 500)
         self.spin_interval.setValue(50)
         self.spin_interval.setSuffix(" ms")
         self.spin_interval.valueChanged.connect(self.on_interval_changed)
-        display_form.addRow("更新间隔:", self.spin_interval)
+        display_form.addRow("采样间隔:", self.spin_interval)
+        
+        self.spin_batch = QSpinBox()
+        self.spin_batch.setRange(1, 100)
+        self.spin_batch.setValue(1)
+        display_form.addRow("每帧采样:", self.spin_batch)
         
         display_group.setLayout(display_form)
         layout.addWidget(display_group)
@@ -233,20 +267,41 @@ class RealtimePlotWindow(QMainWindow):
         self.axes.legend(loc='upper right', facecolor='#1a1a2e', edgecolor='#5d6d7e',
                          labelcolor='#ecf0f1')
         
-        # 设置初始范围
-        self.axes.set_xlim(0, 10)
-        self.axes.set_ylim(-2, 2)
+        # 设置初始范围（缓存当前范围，避免每帧调用set_xlim/set_ylim）
+        self._xlim_cached = (0.0, 10.0)
+        self._ylim_cached = (-2.0, 2.0)
+        self.axes.set_xlim(*self._xlim_cached)
+        self.axes.set_ylim(*self._ylim_cached)
         
         for spine in self.axes.spines.values():
             spine.set_color('#5d6d7e')
         
         self.canvas.fig.tight_layout()
+        
+        # Blitting：曲线设为animated，不参与整图重绘；
+        # 每次整图重绘后缓存坐标区背景，之后每帧只重绘曲线
+        self.line.set_animated(True)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+        self.canvas.draw()
+    
+    def on_draw(self, event):
+        """整图重绘后重新缓存背景"""
+        self.background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self.axes.draw_artist(self.line)
     
     def setup_timer(self):
         """设置定时器"""
+        # 采样定时器：只把数据写入缓冲区
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_data)
         
+        # 绘图定时器：约60Hz，把期间积累的所有新数据合并为一次重绘
+        self.render_timer = QTimer()
+        self.render_timer.setInterval(16)
+        self.render_timer.timeout.connect(self.render_frame)
+        self.dirty = False
+        
         # FPS计算
         self.fps_timer = QTimer()
         self.fps_timer.timeout.connect(self.update_fps)
@@ -259,11 +314,13 @@ class RealtimePlotWindow(QMainWindow):
         """切换采集状态"""
         if self.is_running:
             self.timer.stop()
+            self.render_timer.stop()
             self.is_running = False
             self.btn_start.setText("▶ 开始")
             self.btn_start.setStyleSheet("background-color: #27ae60;")
         else:
             self.timer.start(self.spin_interval.value())
+            self.render_timer.start()
             self.is_running = True
             self.btn_start.setText("⏸ 暂停")
             self.btn_start.setStyleSheet("background-color: #f39c12;")
@@ -273,63 +330,134 @@ class RealtimePlotWindow(QMainWindow):
         # 获取当前时间
         current_time = time.time() - self.start_time
         
-        # 生成模拟数据
-        signal_type = self.combo_signal.currentText()
-        value = self.generate_signal(current_time, signal_type)
+        # 本帧的采样时刻：在上一帧与当前时刻之间均匀分布
+        n = self.spin_batch.value()
+        t = np.linspace(self.last_time, current_time, n + 1)[1:]
+        self.last_time = current_time
         
-        # 添加到缓冲区
-        self.time_data.append(current_time)
-        self.value_data.append(value)
-        self.data_count += 1
+        # 一次性生成整批模拟数据
+        values = self.generate_signal(t)
+        
+        # 添加到缓冲区，标记待重绘（由render_timer统一绘制）
+        self.append_samples(t, values)
+        self.data_count += n
+        self.dirty = True
+    
+    def render_frame(self):
+        """绘制一帧：没有新数据时直接返回"""
+        if not self.dirty:
+            return
+        self.dirty = False
         
         # 更新图形
         self.update_plot()
         
         # 更新状态
         self.label_points.setText(f"数据点: {self.data_count}")
-        self.label_value.setText(f"当前值: {value:.3f}")
+        self.label_value.setText(f"当前值: {self.value_buf[self.head - 1]:.3f}")
         
         self.frame_count += 1
     
-    def generate_signal(self, t: float, signal_type: str) -> float:
-        """生成模拟信号"""
-        noise = random.gauss(0, self.noise_level)
-        
-        if signal_type == "正弦波":
-            return self.amplitude * np.sin(2 * np.pi * self.frequency * t) + noise
-        elif signal_type == "方波":
-            return self.amplitude * np.sign(np.sin(2 * np.pi * self.frequency * t)) + noise
-        elif signal_type == "三角波":
-            return self.amplitude * (2 * abs(2 * (self.frequency * t % 1) - 1) - 1) + noise
-        elif signal_type == "随机游走":
-            if len(self.value_data) > 0:
-                return self.value_data[-1] + random.gauss(0, 0.1)
-            return noise
-        return noise
+    def append_samples(self, t: np.ndarray, values: np.ndarray):
+        """将一批数据写入环形缓冲区"""
+        n = min(len(t), self.max_points)
+        idx = (self.head + np.arange(n)) % self.max_points
+        
+        # 缓冲区已满时，被覆盖的点若是当前极值，则范围需要重算。
+        # 未满时写入位置先占用空槽，真正被覆盖的是最后 evicted 个位置
+        evicted = max(0, self.filled + n - self.max_points)
+        if evicted:
+            old = self.value_buf[idx[n - evicted:]]
+            if old.min() <= self.v_min or old.max() >= self.v_max:
+                self.v_range_stale = True
+        
+        new_values = values[-n:]
+        self.time_buf[idx] = t[-n:]
+        self.value_buf[idx] = new_values
+        self.head = (self.head + n) % self.max_points
+        self.filled = min(self.filled + n, self.max_points)
+        
+        self.v_min = min(self.v_min, new_values.min())
+        self.v_max = max(self.v_max, new_values.max())
+    
+    def on_signal_changed(self, index: int):
+        """波形改变"""
+        self.signal_func = self.signal_funcs[index]
+    
+    def generate_signal(self, t: np.ndarray) -> np.ndarray:
+        """生成一批模拟信号（对时间数组整体向量化计算）"""
+        noise = self.rng.standard_normal(t.size) * self.noise_level
+        return self.signal_func(t, noise)
+    
+    def sine_wave(self, t: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        return self.amplitude * np.sin(2 * np.pi * self.frequency * t) + noise
+    
+    def square_wave(self, t: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        # 前半周期为+1，后半周期为-1，由相位直接得到，无需计算sin
+        phase = self.frequency * t % 1
+        return self.amplitude * (1 - 2 * (phase >= 0.5)) + noise
+    
+    def triangle_wave(self, t: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        phase = self.frequency * t % 1
+        return self.amplitude * (2 * np.abs(2 * phase - 1) - 1) + noise
+    
+    def random_walk(self, t: np.ndarray, noise: np.ndarray) -> np.ndarray:
+        start = self.value_buf[self.head - 1] if self.filled > 0 else 0.0
+        return start + np.cumsum(self.rng.standard_normal(t.size) * 0.1)
+    
+    def buffer_views(self):
+        """按时间顺序返回环形缓冲区中的数据"""
+        if self.filled < self.max_points:
+            return self.time_buf[:self.filled], self.value_buf[:self.filled]
+        order = np.r_[self.head:self.max_points, 0:self.head]
+        return self.time_buf[order], self.value_buf[order]
     
     def update_plot(self):
         """更新图形（高效方式）"""
-        if len(self.time_data) < 2:
+        if self.filled < 2:
             return
         
         # 使用set_data而不是重新绑制
-        self.line.set_data(list(self.time_data), list(self.value_data))
+        t_view, v_view = self.buffer_views()
+        self.line.set_data(t_view, v_view)
         
-        # 自动调整x轴范围
-        x_min = min(self.time_data)
-        x_max = max(self.time_data)
+        # 自动调整x轴范围：时间单调递增，首尾即为最小/最大值
+        # 数据越过右边界时才滚动，并预留10%余量
+        x_min = t_view[0]
+        x_max = t_view[-1]
         if x_max - x_min < 10:
             x_min = max(0, x_max - 10)
-        self.axes.set_xlim(x_min, x_max + 0.5)
+        x_changed = x_max > self._xlim_cached[1] or x_min < self._xlim_cached[0]
         
         # 自动调整y轴范围
-        y_min = min(self.value_data)
-        y_max = max(self.value_data)
+        if self.v_range_stale:
+            self.v_min = v_view.min()
+            self.v_max = v_view.max()
+            self.v_range_stale = False
+        y_min = self.v_min
+        y_max = self.v_max
         margin = (y_max - y_min) * 0.1 + 0.1
-        self.axes.set_ylim(y_min - margin, y_max + margin)
+        ylim = (y_min - margin, y_max + margin)
+        y_changed = limits_changed(self._ylim_cached, ylim)
+        
+        # 范围变化明显时才整图重绘（会触发draw_event重新缓存背景）
+        if x_changed or y_changed:
+            if x_changed:
+                self._xlim_cached = (x_min, x_max + 0.1 * (x_max - x_min) + 0.5)
+                self.axes.set_xlim(*self._xlim_cached)
+            if y_changed:
+                self._ylim_cached = ylim
+                self.axes.set_ylim(*ylim)
+            self.canvas.draw()
+            return
         
-        # 刷新画布
-        self.canvas.draw()
+        # 否则只恢复背景并重绘曲线
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        self.axes.draw_artist(self.line)
+        self.canvas.blit(self.axes.bbox)
+        self.canvas.flush_events()
     
     def update_fps(self):
         """更新FPS显示"""
@@ -338,14 +466,21 @@ class RealtimePlotWindow(QMainWindow):
     
     def clear_data(self):
         """清除数据"""
-        self.time_data.clear()
-        self.value_data.clear()
+        self.head = 0
+        self.filled = 0
+        self.v_min = np.inf
+        self.v_max = -np.inf
+        self.v_range_stale = False
+        self.dirty = False
         self.data_count = 0
         self.start_time = time.time()
+        self.last_time = 0.0
         
         self.line.set_data([], [])
-        self.axes.set_xlim(0, 10)
-        self.axes.set_ylim(-2, 2)
+        self._xlim_cached = (0.0, 10.0)
+        self._ylim_cached = (-2.0, 2.0)
+        self.axes.set_xlim(*self._xlim_cached)
+        self.axes.set_ylim(*self._ylim_cached)
         self.canvas.draw()
         
         self.label_points.setText("数据点: 0")
@@ -353,18 +488,35 @@ class RealtimePlotWindow(QMainWindow):
     
     def on_max_points_changed(self, value: int):
         """最大点数改变"""
+        # 保留最近的数据，重新分配缓冲区
+        t_view, v_view = self.buffer_views()
+        keep = min(self.filled, value)
+        
         self.max_points = value
-        self.time_data = deque(list(self.time_data)[-value:], maxlen=value)
-        self.value_data = deque(list(self.value_data)[-value:], maxlen=value)
+        self.time_buf = np.empty(value)
+        self.value_buf = np.empty(value)
+        self.time_buf[:keep] = t_view[self.filled - keep:]
+        self.value_buf[:keep] = v_view[self.filled - keep:]
+        self.filled = keep
+        self.head = keep % value
+        self.v_range_stale = True
     
     def on_interval_changed(self, value: int):
-        """更新间隔改变"""
+        """采样间隔改变"""
         if self.is_running:
             self.timer.setInterval(value)
 
 
 class MultiChannelRealtime(QMainWindow):
-    """多通道实时数据"""
+    """
+    多通道实时数据
+    
+    安装了pyqtgraph时使用PlotWidget绘制（QPainter直接绘线，
+    适合高频数据流）；否则退回Matplotlib + blitting。
+    """
+    
+    COLORS = ['c', 'g', 'r', 'y']
+    WARMUP_SAMPLES = 50
     
     def __init__(self):
         super().__init__()
@@ -375,7 +527,48 @@ class MultiChannelRealtime(QMainWindow):
         self.setCentralWidget(central)
         layout = QVBoxLayout(central)
         
-        # 创建画布（多子图）
+        # 数据（每通道一行的NumPy环形缓冲区）
+        self.max_points = 100
+        self.data = np.zeros((4, self.max_points))
+        self.head = 0
+        self.filled = 0
+        
+        if PYQTGRAPH_AVAILABLE:
+            self.init_pyqtgraph(layout)
+        else:
+            self.init_matplotlib(layout)
+        
+        # 定时器
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_data)
+        self.timer.start(50)
+        
+        self.t = 0
+        
+        self.setStyleSheet("QMainWindow { background-color: #0d1117; }")
+    
+    def init_pyqtgraph(self, layout):
+        """使用pyqtgraph创建4个子图"""
+        pg.setConfigOptions(antialias=False)
+        
+        self.plot_widget = pg.GraphicsLayoutWidget()
+        self.plot_widget.setBackground('#1a1a2e')
+        
+        self.curves = []
+        for i in range(4):
+            plot = self.plot_widget.addPlot(row=i // 2, col=i % 2,
+                                            title=f'通道 {i + 1}')
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            plot.setXRange(0, self.max_points, padding=0)
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setClipToView(True)
+            curve = plot.plot(pen=pg.mkPen(self.COLORS[i], width=1.5))
+            self.curves.append(curve)
+        
+        layout.addWidget(self.plot_widget)
+    
+    def init_matplotlib(self, layout):
+        """使用Matplotlib创建4个子图"""
         self.fig = Figure(figsize=(10, 8), dpi=100)
         self.fig.set_facecolor('#1a1a2e')
         self.canvas = FigureCanvas(self.fig)
@@ -394,52 +587,88 @@ class MultiChannelRealtime(QMainWindow):
         self.fig.tight_layout()
         layout.addWidget(self.canvas)
         
-        # 数据
-        self.max_points = 100
-        self.data = [deque(maxlen=self.max_points) for _ in range(4)]
         self.lines = []
-        
+        self._ylims = [(-2.0, 2.0)] * 4
         for i, ax in enumerate(self.axes):
-            line, = ax.plot([], [], ['c-', 'g-', 'r-', 'y-'][i], linewidth=1.5)
+            line, = ax.plot([], [], f'{self.COLORS[i]}-', linewidth=1.5,
+                            animated=True)
             ax.set_xlim(0, self.max_points)
             ax.set_ylim(-2, 2)
             ax.grid(True, alpha=0.3, color='#5d6d7e')
             self.lines.append(line)
         
-        # 定时器
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_data)
-        self.timer.start(50)
-        
-        self.t = 0
-        
-        self.setStyleSheet("QMainWindow { background-color: #0d1117; }")
+        # 每个子图各缓存一份背景
+        self.backgrounds = []
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        """整图重绘后重新缓存各子图背景"""
+        self.backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axes]
+        for ax, line in zip(self.axes, self.lines):
+            ax.draw_artist(line)
     
     def update_data(self):
         """更新多通道数据"""
         self.t += 1
         
         # 生成4通道数据
-        signals = [
+        signals = np.array([
             np.sin(2 * np.pi * 0.5 * self.t / 20),
             np.cos(2 * np.pi * 0.3 * self.t / 20),
             np.sin(2 * np.pi * 0.7 * self.t / 20) * 0.5,
             random.gauss(0, 0.5),
-        ]
+        ])
         
-        for i, (data, signal) in enumerate(zip(self.data, signals)):
-            data.append(signal + random.gauss(0, 0.1))
-            
-            x = list(range(len(data)))
-            self.lines[i].set_data(x, list(data))
+        self.data[:, self.head] = signals + np.random.normal(0, 0.1, 4)
+        self.head = (self.head + 1) % self.max_points
+        self.filled = min(self.filled + 1, self.max_points)
+        
+        # 按时间顺序排列的数据（每行一个通道）
+        if self.filled < self.max_points:
+            ordered = self.data[:, :self.filled]
+        else:
+            ordered = np.roll(self.data, -self.head, axis=1)
+        
+        if PYQTGRAPH_AVAILABLE:
+            # pyqtgraph会自动安排重绘，无需显式draw()
+            for curve, y in zip(self.curves, ordered):
+                curve.setData(y)
+        else:
+            self.update_matplotlib(ordered)
+    
+    def update_matplotlib(self, ordered: np.ndarray):
+        """Matplotlib后备绘图路径"""
+        x = np.arange(ordered.shape[1])
+        
+        need_redraw = False
+        for i, y in enumerate(ordered):
+            self.lines[i].set_data(x, y)
             
-            if len(data) > 10:
-                y_data = list(data)
-                y_min, y_max = min(y_data), max(y_data)
+            if len(y) > 10:
+                y_min, y_max = y.min(), y.max()
                 margin = (y_max - y_min) * 0.1 + 0.2
-                self.axes[i].set_ylim(y_min - margin, y_max + margin)
+                ylim = (y_min - margin, y_max + margin)
+                lo, hi = self._ylims[i]
+                # 预热阶段跟随数据调整；之后固定y轴，除非信号超出范围
+                if len(y) < self.WARMUP_SAMPLES:
+                    changed = limits_changed(self._ylims[i], ylim)
+                else:
+                    changed = y_min < lo or y_max > hi
+                if changed:
+                    self._ylims[i] = ylim
+                    self.axes[i].set_ylim(*ylim)
+                    need_redraw = True
+        
+        if need_redraw or not self.backgrounds:
+            self.canvas.draw()
+            return
         
-        self.canvas.draw()
+        # 4个通道都绘制到画布缓冲区后，整幅图只 blit 一次
+        for ax, line, background in zip(self.axes, self.lines, self.backgrounds):
+            self.canvas.restore_region(background)
+            ax.draw_artist(line)
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
 
 
 def main():
@@ -459,9 +688,10 @@ def main():
     print("=" * 50)
     print("优化技术:")
     print("  1. 使用set_data()而不是clear()+plot()")
-    print("  2. 使用deque限制数据点数")
+    print("  2. 使用环形缓冲区限制数据点数")
     print("  3. 只更新必要的图形元素")
-    print("  4. 合理设置更新间隔")
+    print("  4. 采样与绘图解耦，绘图合并到约60Hz")
+    print(f"多通道绘图后端: {'pyqtgraph' if PYQTGRAPH_AVAILABLE else 'Matplotlib'}")
     print("=" * 50)
     
     sys.exit(app.exec())
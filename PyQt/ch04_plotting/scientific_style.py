@@ -15,6 +15,8 @@
 """
 
 import sys
+from contextlib import contextmanager
+from types import MappingProxyType
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -26,6 +28,8 @@ from PyQt6.QtCore import Qt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.collections import PathCollection
+from matplotlib.container import Container
 import matplotlib.pyplot as plt
 from cycler import cycler
 
@@ -106,22 +110,146 @@ STYLES = {
     },
 }
 
-# 颜色方案
+
+def _render_code(style) -> str:
+    """生成样式的rcParams代码预览文本（只列出前5项）"""
+    code_lines = ["plt.rcParams.update({"]
+    for key, value in list(style.items())[:5]:
+        if isinstance(value, str):
+            code_lines.append(f"    '{key}': '{value}',")
+        else:
+            code_lines.append(f"    '{key}': {value},")
+    if len(style) > 5:
+        code_lines.append("    # ... 更多参数 ...")
+    code_lines.append("})")
+    return "\n".join(code_lines)
+
+
+# 代码预览按各样式自身的参数生成
+_CODE_PREVIEW = {name: _render_code(style) for name, style in STYLES.items()}
+
+# 各样式以"默认"为基础合并，并冻结为只读映射
+STYLES = {
+    name: MappingProxyType({**STYLES["默认"], **style})
+    for name, style in STYLES.items()
+}
+
+# 颜色方案（元组，防止被意外修改）
 COLOR_SCHEMES = {
-    "经典": ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'],
-    "色盲友好": ['#0072B2', '#E69F00', '#009E73', '#CC79A7', '#F0E442', '#56B4E9'],
-    "自然": ['#4C72B0', '#55A868', '#C44E52', '#8172B2', '#CCB974', '#64B5CD'],
-    "Pastel": ['#AEC7E8', '#FFBB78', '#98DF8A', '#FF9896', '#C5B0D5', '#C49C94'],
-    "深色": ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c'],
+    "经典": ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b'),
+    "色盲友好": ('#0072B2', '#E69F00', '#009E73', '#CC79A7', '#F0E442', '#56B4E9'),
+    "自然": ('#4C72B0', '#55A868', '#C44E52', '#8172B2', '#CCB974', '#64B5CD'),
+    "Pastel": ('#AEC7E8', '#FFBB78', '#98DF8A', '#FF9896', '#C5B0D5', '#C49C94'),
+    "深色": ('#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c'),
 }
 
+# 各颜色方案对应的颜色循环
+_CYCLERS = {name: cycler(color=colors) for name, colors in COLOR_SCHEMES.items()}
+
+# 颜色预览HTML，每种方案只生成一次
+COLOR_PREVIEW_HTML = {
+    name: " ".join(f'<span style="color:{c}; font-size:20px;">●</span>' for c in colors)
+    for name, colors in COLOR_SCHEMES.items()
+}
+
+
+def linfit_r2(x, y):
+    """
+    一元线性最小二乘拟合（闭式解）
+    
+    返回 (斜率, 截距, 拟合值, R²)
+    """
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    dy = y - y_mean
+    m = np.dot(dx, dy) / np.dot(dx, dx)
+    b = y_mean - m * x_mean
+    y_fit = m * x + b
+    resid = y - y_fit
+    r2 = 1.0 - np.dot(resid, resid) / np.dot(dy, dy)
+    return m, b, y_fit, r2
+
+
+# ============================================================
+# 示例数据（固定不变，模块加载时计算一次）
+# ============================================================
+
+# 多曲线对比
+_X_CURVES = np.linspace(0, 2 * np.pi, 100)
+_Y_CURVES_STACK = np.column_stack([np.sin(n * _X_CURVES) / n for n in (1, 2, 3)])
+
+# 带误差棒
+_X_ERR = np.array([1, 2, 3, 4, 5, 6, 7, 8])
+_Y1_ERR = np.array([2.3, 3.1, 4.2, 4.8, 5.5, 6.1, 6.8, 7.2])
+_Y2_ERR = np.array([1.8, 2.5, 3.0, 3.8, 4.2, 4.9, 5.3, 5.8])
+_ERR_RNG = np.random.default_rng(1)
+_YERR1_ERR = _ERR_RNG.uniform(0.2, 0.5, len(_X_ERR))
+_YERR2_ERR = _ERR_RNG.uniform(0.2, 0.4, len(_X_ERR))
+
+# 散点拟合：数据、线性拟合及R²
+_X_SCATTER = np.linspace(0, 10, 30)
+_Y_SCATTER = 2.5 * _X_SCATTER + 1.0 + np.random.default_rng(42).standard_normal(30) * 2
+_FIT_M, _FIT_B, _Y_FIT, _R2 = linfit_r2(_X_SCATTER, _Y_SCATTER)
+
+# 双Y轴
+_X_DUAL = np.linspace(0, 10, 100)
+_Y1_DUAL = np.sin(_X_DUAL) * np.exp(-0.1 * _X_DUAL)
+_Y2_DUAL = 100 * np.exp(-0.3 * _X_DUAL)
+
+
+# 应用级样式表：在main()中设置一次，各控件按objectName匹配
+_APP_QSS = """
+    QMainWindow { background-color: #f5f6fa; }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #27ae60;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 10px;
+        background-color: white;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 8px;
+    }
+    QComboBox {
+        padding: 5px;
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+    }
+    QPushButton {
+        padding: 8px 16px;
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #219a52; }
+    QLabel#panelTitle { font-size: 16px; font-weight: bold; color: #2c3e50; }
+    QLabel#exportHint { color: #7f8c8d; font-size: 11px; }
+    QLabel#codePreview {
+        background-color: #2c3e50;
+        color: #00ff88;
+        font-family: Consolas, monospace;
+        font-size: 10px;
+        padding: 10px;
+        border-radius: 5px;
+    }
+"""
+
 
 class MplCanvas(FigureCanvas):
     """Matplotlib画布"""
     
     def __init__(self, parent=None, width=8, height=6, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
+        # constrained布局在每次绘制时自动调整，无需反复调用tight_layout
+        self.fig = Figure(figsize=(width, height), dpi=dpi, layout='constrained')
         self.axes = self.fig.add_subplot(111)
+        # 高分屏无需手动放大dpi：QtAgg画布会按devicePixelRatio
+        # 以物理像素渲染，窗口移到其他屏幕时也会自动更新
         super().__init__(self.fig)
 
 
@@ -132,7 +260,39 @@ class ScientificStyleDemo(QMainWindow):
         super().__init__()
         self.current_style = "默认"
         self.current_colors = "经典"
+        
+        # 已应用的(样式, 颜色方案)及合并后的rcParams缓存
+        self._last_applied = (None, None)
+        self._style_cache = {}
+        
+        # 双Y轴模式的右侧坐标轴，首次使用时创建并复用
+        self._ax2 = None
+        
+        # 图元对应的样式、当前显示的数据类型，
+        # 以及按数据类型缓存的图元和坐标范围（切换时只改变可见性）
+        self._plotted_style = None
+        self._mode = None
+        self._artists = {}
+        self._mode_limits = {}
+        
+        # 批量修改控件期间为True，此时各槽函数不重绘
+        self._updating = False
+        
         self.init_ui()
+        
+        # 初始状态写入控件，结束后只绘制一次
+        with self._batch():
+            self.combo_style.setCurrentText(self.current_style)
+            self.combo_colors.setCurrentText(self.current_colors)
+    
+    @contextmanager
+    def _batch(self):
+        """批量更新控件：期间的信号不触发重绘，结束时统一绘制一次"""
+        self._updating = True
+        try:
+            yield
+        finally:
+            self._updating = False
         self.update_plot()
     
     def init_ui(self):
@@ -158,50 +318,12 @@ class ScientificStyleDemo(QMainWindow):
         
         # 样式代码预览
         self.label_code = QLabel("")
-        self.label_code.setStyleSheet("""
-            background-color: #2c3e50;
-            color: #00ff88;
-            font-family: Consolas, monospace;
-            font-size: 10px;
-            padding: 10px;
-            border-radius: 5px;
-        """)
+        self.label_code.setObjectName("codePreview")
         self.label_code.setWordWrap(True)
         self.label_code.setMaximumHeight(100)
         plot_layout.addWidget(self.label_code)
         
         main_layout.addLayout(plot_layout, stretch=1)
-        
-        self.setStyleSheet("""
-            QMainWindow { background-color: #f5f6fa; }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #27ae60;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #219a52; }
-        """)
     
     def create_control_panel(self) -> QWidget:
         """创建控制面板"""
@@ -210,7 +332,7 @@ class ScientificStyleDemo(QMainWindow):
         layout = QVBoxLayout(panel)
         
         title = QLabel("🎨 样式设置")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
         
         # 预设样式
@@ -248,12 +370,12 @@ class ScientificStyleDemo(QMainWindow):
         
         self.check_grid = QCheckBox("显示网格")
         self.check_grid.setChecked(True)
-        self.check_grid.stateChanged.connect(self.update_plot)
+        self.check_grid.stateChanged.connect(self.on_grid_toggled)
         option_layout.addWidget(self.check_grid)
         
         self.check_legend = QCheckBox("显示图例")
         self.check_legend.setChecked(True)
-        self.check_legend.stateChanged.connect(self.update_plot)
+        self.check_legend.stateChanged.connect(self.on_legend_toggled)
         option_layout.addWidget(self.check_legend)
         
         self.check_math = QCheckBox("使用数学公式")
@@ -288,7 +410,7 @@ class ScientificStyleDemo(QMainWindow):
             "提示: 使用工具栏💾按钮\n"
             "可保存为 PNG/PDF/SVG"
         )
-        export_info.setStyleSheet("color: #7f8c8d; font-size: 11px;")
+        export_info.setObjectName("exportHint")
         layout.addWidget(export_info)
         
         return panel
@@ -296,100 +418,225 @@ class ScientificStyleDemo(QMainWindow):
     def on_style_changed(self, style_name: str):
         """样式改变"""
         self.current_style = style_name
+        if self._updating:
+            return
         self.update_plot()
     
     def on_colors_changed(self, color_name: str):
         """颜色方案改变"""
         self.current_colors = color_name
         self.update_color_preview()
+        if self._updating:
+            return
         self.update_plot()
     
+    def on_grid_toggled(self):
+        """网格开关：只改变网格线，不重新绑图"""
+        self.apply_grid(self.canvas.axes)
+        self.canvas.draw_idle()
+    
+    def on_legend_toggled(self):
+        """图例开关：只切换图例可见性，不重新绑图"""
+        legend = self.canvas.axes.get_legend()
+        if legend is not None:
+            legend.set_visible(self.check_legend.isChecked())
+            self.canvas.draw_idle()
+    
+    def apply_grid(self, ax):
+        """按复选框状态显示/隐藏网格"""
+        if self.check_grid.isChecked():
+            ax.grid(True, alpha=0.3)
+        else:
+            ax.grid(False)
+    
     def update_color_preview(self):
         """更新颜色预览"""
-        colors = COLOR_SCHEMES.get(self.current_colors, COLOR_SCHEMES["经典"])
-        html = " ".join([f'<span style="color:{c}; font-size:20px;">●</span>' for c in colors])
-        self.label_color_preview.setText(html)
+        self.label_color_preview.setText(COLOR_PREVIEW_HTML[self.current_colors])
     
     def apply_style(self):
-        """应用当前样式"""
-        style = STYLES.get(self.current_style, STYLES["默认"])
-        
-        # 重置为默认值
-        plt.rcdefaults()
-        
-        # 应用新样式
-        for key, value in style.items():
-            try:
-                plt.rcParams[key] = value
-            except:
-                pass
-        
-        # 应用颜色
-        colors = COLOR_SCHEMES.get(self.current_colors, COLOR_SCHEMES["经典"])
-        plt.rcParams['axes.prop_cycle'] = cycler(color=colors)
+        """应用当前样式（样式和颜色方案都未改变时直接返回）"""
+        key = (self.current_style, self.current_colors)
+        if key == self._last_applied:
+            return
+        
+        # 每种组合只构建一次：样式参数 + 颜色循环
+        merged = self._style_cache.get(key)
+        if merged is None:
+            style = STYLES.get(self.current_style, STYLES["默认"])
+            merged = {k: v for k, v in style.items() if k in plt.rcParams}
+            merged['axes.prop_cycle'] = _CYCLERS.get(self.current_colors, _CYCLERS["经典"])
+            self._style_cache[key] = merged
+        
+        # 样式改变时才需要先重置为默认值
+        if self.current_style != self._last_applied[0]:
+            plt.rcdefaults()
+        
+        plt.rcParams.update(merged)
+        self._last_applied = key
     
     def update_plot(self):
         """更新图形"""
+        if self._updating:
+            return
+        
         # 应用样式
         self.apply_style()
         
         # 获取选项
-        show_grid = self.check_grid.isChecked()
-        show_legend = self.check_legend.isChecked()
         use_math = self.check_math.isChecked()
         data_type = self.combo_data.currentIndex()
         
-        # 重新创建Figure以应用新样式
+        # 按样式设置图形尺寸
         style = STYLES.get(self.current_style, STYLES["默认"])
         figsize = style.get('figure.figsize', (8, 6))
         
-        self.canvas.fig.clear()
         self.canvas.fig.set_size_inches(figsize)
         
-        # 应用Figure背景色
-        if 'figure.facecolor' in style:
-            self.canvas.fig.set_facecolor(style['figure.facecolor'])
-        else:
-            self.canvas.fig.set_facecolor('white')
-        
-        ax = self.canvas.fig.add_subplot(111)
-        
-        # 应用axes背景色
-        if 'axes.facecolor' in style:
-            ax.set_facecolor(style['axes.facecolor'])
+        # 背景色直接取自apply_style写入的rcParams
+        self.canvas.fig.set_facecolor(plt.rcParams['figure.facecolor'])
+        
+        ax = self.canvas.axes
+        
+        # 样式改变时清空坐标轴，各数据类型的图元按需重新创建；
+        # 切换颜色、数学公式时直接修改已缓存的图元
+        if self.current_style != self._plotted_style:
+            self.reset_axes(ax)
+            if self._ax2 is not None:
+                # 右侧Y轴与主坐标轴共享x轴，残留的曲线会影响其他模式的自动范围
+                self.reset_axes(self._ax2)
+            self._artists.clear()
+            self._mode_limits.clear()
+            self._plotted_style = self.current_style
+            self._mode = None
+        
+        # 数据类型改变时隐藏上一类图元，显示已创建过的本类图元
+        switched = data_type != self._mode
+        if switched:
+            self.set_mode_visible(self._mode, False)
+            if self._mode == 3:
+                self.reset_label_colors(ax)
+            self.set_mode_visible(data_type, True)
+            # 共享x轴的自动范围包含右侧Y轴的dataLim，按其可见曲线重算：
+            # 离开双Y轴模式时为空，回到该模式时恢复
+            if self._ax2 is not None and 3 in (self._mode, data_type):
+                self._ax2.relim(visible_only=True)
+            self._mode = data_type
+        built = data_type not in self._artists
+        
+        ax.set_facecolor(plt.rcParams['axes.facecolor'])
+        
+        if self._ax2 is not None:
+            self._ax2.set_visible(data_type == 3)
         
         colors = COLOR_SCHEMES.get(self.current_colors, COLOR_SCHEMES["经典"])
         
         # 根据数据类型绑图
         if data_type == 0:  # 多曲线对比
-            self.plot_multiple_curves(ax, colors, use_math, show_legend)
+            self.plot_multiple_curves(ax, colors, use_math)
         elif data_type == 1:  # 带误差棒
-            self.plot_with_errorbars(ax, colors, use_math, show_legend)
+            self.plot_with_errorbars(ax, colors, use_math)
         elif data_type == 2:  # 散点拟合
-            self.plot_scatter_fit(ax, colors, use_math, show_legend)
+            self.plot_scatter_fit(ax, colors, use_math)
         elif data_type == 3:  # 双Y轴
-            self.plot_dual_axis(ax, colors, use_math, show_legend)
+            self.plot_dual_axis(ax, colors, use_math)
         
-        if show_grid:
-            ax.grid(True, alpha=0.3)
+        # 新建的图元计算一次坐标范围，之后切换回来时直接恢复
+        if built:
+            self._mode_limits[data_type] = self.autoscale_visible(ax, data_type)
+        elif switched:
+            xlim, ylim = self._mode_limits[data_type]
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
         
-        self.canvas.fig.tight_layout()
-        self.canvas.draw()
+        # 图例总是创建，由复选框控制可见性，切换时无需重绘
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.set_visible(self.check_legend.isChecked())
+        self.apply_grid(ax)
+        
+        self.canvas.draw_idle()
         
         # 更新代码预览
         self.update_code_preview()
     
-    def plot_multiple_curves(self, ax, colors, use_math, show_legend):
+    def reset_axes(self, ax):
+        """清空坐标轴，并重新应用cla()不会更新的边框样式和Y轴标签颜色"""
+        ax.cla()
+        for spine in ax.spines.values():
+            spine.set_edgecolor(plt.rcParams['axes.edgecolor'])
+            spine.set_linewidth(plt.rcParams['axes.linewidth'])
+        # tick_params 设置的刻度标签颜色不会被cla()清除（如双Y轴模式的着色）
+        self.reset_label_colors(ax)
+    
+    def twin_axes(self, ax):
+        """获取双Y轴模式的右侧坐标轴（首次创建，之后清空复用）"""
+        if self._ax2 is None:
+            self._ax2 = ax.twinx()
+            return self._ax2
+        
+        ax2 = self._ax2
+        self.reset_axes(ax2)
+        # cla()会恢复默认刻度位置，需重新放到右侧
+        ax2.yaxis.tick_right()
+        ax2.yaxis.set_label_position('right')
+        ax2.yaxis.set_offset_position('right')
+        ax2.xaxis.set_visible(False)
+        ax2.patch.set_visible(False)
+        return ax2
+    
+    def set_mode_visible(self, mode, visible):
+        """显示/隐藏某一数据类型的全部图元"""
+        for artist in self._artists.get(mode, ()):
+            if isinstance(artist, Container):
+                for child in artist.get_children():
+                    child.set_visible(visible)
+            else:
+                artist.set_visible(visible)
+    
+    def autoscale_visible(self, ax, mode):
+        """只按可见图元计算坐标范围（relim不包含散点，需单独加入）"""
+        ax.set_autoscale_on(True)
+        ax.relim(visible_only=True)
+        for artist in self._artists[mode]:
+            if isinstance(artist, PathCollection):
+                ax.update_datalim(artist.get_offsets())
+        ax.autoscale_view()
+        return ax.get_xlim(), ax.get_ylim()
+    
+    @staticmethod
+    def reset_label_colors(ax):
+        """按当前rcParams恢复Y轴标签和刻度标签颜色（双Y轴模式会修改它们）"""
+        ax.yaxis.label.set_color(plt.rcParams['axes.labelcolor'])
+        labelcolor = plt.rcParams['ytick.labelcolor']
+        if labelcolor == 'inherit':
+            labelcolor = plt.rcParams['ytick.color']
+        ax.tick_params(axis='y', labelcolor=labelcolor)
+    
+    @staticmethod
+    def set_errorbar_color(container, color):
+        """设置误差棒容器中数据线、端帽和误差线的颜色"""
+        data_line, caplines, barlinecols = container.lines
+        data_line.set_color(color)
+        for cap in caplines:
+            cap.set_color(color)
+        for col in barlinecols:
+            col.set_color(color)
+    
+    def plot_multiple_curves(self, ax, colors, use_math):
         """多曲线对比图"""
-        x = np.linspace(0, 2 * np.pi, 100)
+        lines = self._artists.get(0)
+        if lines is None:
+            # 二维数组按列一次绘制三条曲线
+            lines = ax.plot(_X_CURVES, _Y_CURVES_STACK, linewidth=1.5)
+            self._artists[0] = lines
         
-        for i, n in enumerate([1, 2, 3]):
-            y = np.sin(n * x) / n
+        for n, (line, color) in enumerate(zip(lines, colors), start=1):
             if use_math:
                 label = f'$\\sin({n}x)/{n}$'
             else:
                 label = f'sin({n}x)/{n}'
-            ax.plot(x, y, color=colors[i], linewidth=1.5, label=label)
+            line.set_color(color)
+            line.set_label(label)
         
         if use_math:
             ax.set_xlabel(r'$x$ (rad)')
@@ -400,21 +647,22 @@ class ScientificStyleDemo(QMainWindow):
             ax.set_ylabel('f(x)')
             ax.set_title('傅里叶级数分量')
         
-        if show_legend:
-            ax.legend(loc='upper right')
+        ax.legend(handles=lines, loc='upper right')
     
-    def plot_with_errorbars(self, ax, colors, use_math, show_legend):
+    def plot_with_errorbars(self, ax, colors, use_math):
         """带误差棒的图"""
-        x = np.array([1, 2, 3, 4, 5, 6, 7, 8])
-        y1 = np.array([2.3, 3.1, 4.2, 4.8, 5.5, 6.1, 6.8, 7.2])
-        y2 = np.array([1.8, 2.5, 3.0, 3.8, 4.2, 4.9, 5.3, 5.8])
-        yerr1 = np.random.uniform(0.2, 0.5, len(x))
-        yerr2 = np.random.uniform(0.2, 0.4, len(x))
-        
-        ax.errorbar(x, y1, yerr=yerr1, fmt='o-', color=colors[0], 
-                    capsize=4, capthick=1.5, label='样品 A')
-        ax.errorbar(x, y2, yerr=yerr2, fmt='s--', color=colors[1], 
-                    capsize=4, capthick=1.5, label='样品 B')
+        containers = self._artists.get(1)
+        if containers is None:
+            containers = [
+                ax.errorbar(_X_ERR, _Y1_ERR, yerr=_YERR1_ERR, fmt='o-',
+                            capsize=4, capthick=1.5, label='样品 A'),
+                ax.errorbar(_X_ERR, _Y2_ERR, yerr=_YERR2_ERR, fmt='s--',
+                            capsize=4, capthick=1.5, label='样品 B'),
+            ]
+            self._artists[1] = containers
+        
+        for container, color in zip(containers, colors):
+            self.set_errorbar_color(container, color)
         
         if use_math:
             ax.set_xlabel(r'温度 $T$ (K)')
@@ -424,85 +672,71 @@ class ScientificStyleDemo(QMainWindow):
             ax.set_ylabel('电阻率 (mΩ·cm)')
         ax.set_title('电阻率-温度依赖关系')
         
-        if show_legend:
-            ax.legend(loc='upper left')
+        ax.legend(handles=containers, loc='upper left')
     
-    def plot_scatter_fit(self, ax, colors, use_math, show_legend):
+    def plot_scatter_fit(self, ax, colors, use_math):
         """散点拟合图"""
-        np.random.seed(42)
-        x = np.linspace(0, 10, 30)
-        y_true = 2.5 * x + 1.0
-        y = y_true + np.random.randn(len(x)) * 2
-        
-        # 线性拟合
-        coeffs = np.polyfit(x, y, 1)
-        y_fit = np.polyval(coeffs, x)
-        
-        ax.scatter(x, y, c=colors[0], s=50, alpha=0.7, label='实验数据')
-        ax.plot(x, y_fit, color=colors[1], linewidth=2, 
-                label=f'拟合: y = {coeffs[0]:.2f}x + {coeffs[1]:.2f}')
-        
-        # R²值
-        ss_res = np.sum((y - y_fit) ** 2)
-        ss_tot = np.sum((y - np.mean(y)) ** 2)
-        r2 = 1 - ss_res / ss_tot
+        artists = self._artists.get(2)
+        if artists is None:
+            artists = [
+                ax.scatter(_X_SCATTER, _Y_SCATTER, s=50, alpha=0.7, label='实验数据'),
+                ax.plot(_X_SCATTER, _Y_FIT, linewidth=2,
+                        label=f'拟合: y = {_FIT_M:.2f}x + {_FIT_B:.2f}')[0],
+                ax.text(0.05, 0.95, '', transform=ax.transAxes,
+                        fontsize=10, verticalalignment='top'),
+            ]
+            self._artists[2] = artists
+        
+        scatter, fit_line, text_r2 = artists
+        scatter.set_color(colors[0])
+        fit_line.set_color(colors[1])
         
         if use_math:
-            ax.text(0.05, 0.95, f'$R^2 = {r2:.4f}$', transform=ax.transAxes,
-                    fontsize=10, verticalalignment='top')
+            text_r2.set_text(f'$R^2 = {_R2:.4f}$')
             ax.set_xlabel(r'自变量 $x$')
             ax.set_ylabel(r'因变量 $y$')
         else:
-            ax.text(0.05, 0.95, f'R² = {r2:.4f}', transform=ax.transAxes,
-                    fontsize=10, verticalalignment='top')
+            text_r2.set_text(f'R² = {_R2:.4f}')
             ax.set_xlabel('自变量 x')
             ax.set_ylabel('因变量 y')
         ax.set_title('线性回归拟合')
         
-        if show_legend:
-            ax.legend(loc='lower right')
+        ax.legend(handles=[scatter, fit_line], loc='lower right')
     
-    def plot_dual_axis(self, ax, colors, use_math, show_legend):
+    def plot_dual_axis(self, ax, colors, use_math):
         """双Y轴图"""
-        x = np.linspace(0, 10, 100)
-        y1 = np.sin(x) * np.exp(-0.1 * x)
-        y2 = 100 * np.exp(-0.3 * x)
+        lines = self._artists.get(3)
+        if lines is None:
+            ax2 = self.twin_axes(ax)
+            lines = [
+                ax.plot(_X_DUAL, _Y1_DUAL, linewidth=2, label='振幅')[0],
+                ax2.plot(_X_DUAL, _Y2_DUAL, linewidth=2, linestyle='--', label='温度')[0],
+            ]
+            self._artists[3] = lines
+        ax2 = self._ax2
+        
+        line1, line2 = lines
+        line1.set_color(colors[0])
+        line2.set_color(colors[2])
         
-        ax.plot(x, y1, color=colors[0], linewidth=2, label='振幅')
         ax.set_xlabel('时间 (s)')
         ax.set_ylabel('振幅 (a.u.)', color=colors[0])
         ax.tick_params(axis='y', labelcolor=colors[0])
-        
-        ax2 = ax.twinx()
-        ax2.plot(x, y2, color=colors[2], linewidth=2, linestyle='--', label='温度')
         ax2.set_ylabel('温度 (K)', color=colors[2])
         ax2.tick_params(axis='y', labelcolor=colors[2])
         
         ax.set_title('双Y轴: 振幅与温度随时间变化')
         
-        if show_legend:
-            lines1, labels1 = ax.get_legend_handles_labels()
-            lines2, labels2 = ax2.get_legend_handles_labels()
-            ax.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
+        ax.legend(handles=lines, loc='upper right')
     
     def update_code_preview(self):
         """更新代码预览"""
-        style = STYLES.get(self.current_style, STYLES["默认"])
-        code_lines = ["plt.rcParams.update({"]
-        for key, value in list(style.items())[:5]:
-            if isinstance(value, str):
-                code_lines.append(f"    '{key}': '{value}',")
-            else:
-                code_lines.append(f"    '{key}': {value},")
-        if len(style) > 5:
-            code_lines.append("    # ... 更多参数 ...")
-        code_lines.append("})")
-        
-        self.label_code.setText("\n".join(code_lines))
+        self.label_code.setText(_CODE_PREVIEW[self.current_style])
 
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(_APP_QSS)
     
     window = ScientificStyleDemo()
     window.show()
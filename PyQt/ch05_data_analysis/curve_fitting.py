@@ -15,7 +15,8 @@
 
 import sys
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
+from scipy.sparse import block_diag
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QGroupBox, QFormLayout,
@@ -27,69 +28,239 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
+# 可选：numexpr 将整个表达式融合为一次（多线程）遍历
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
 
 # ============================================================
 # 拟合函数定义
 # ============================================================
+# 拟合迭代中会反复调用模型函数，以下几个常用模型只分配一个
+# 结果数组，中间步骤都在该数组上原地计算
 
 def gaussian(x, A, mu, sigma, C):
     """高斯函数"""
-    return A * np.exp(-(x - mu)**2 / (2 * sigma**2)) + C
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate("A * exp(-(x - mu)**2 / (2 * sigma**2)) + C")
+    out = np.subtract(x, mu, dtype=float)
+    np.square(out, out=out)
+    out *= -0.5 / sigma**2
+    np.exp(out, out=out)
+    out *= A
+    out += C
+    return out
 
 def lorentzian(x, A, x0, gamma, C):
     """洛伦兹函数"""
-    return A * (gamma/2)**2 / ((x - x0)**2 + (gamma/2)**2) + C
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate("A * (gamma/2)**2 / ((x - x0)**2 + (gamma/2)**2) + C")
+    hw2 = (gamma/2)**2
+    out = np.subtract(x, x0, dtype=float)
+    np.square(out, out=out)
+    out += hw2
+    np.reciprocal(out, out=out)
+    out *= A * hw2
+    out += C
+    return out
 
 def exponential(x, A, tau, C):
     """指数衰减"""
-    return A * np.exp(-x / tau) + C
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate("A * exp(-x / tau) + C")
+    out = np.multiply(x, -1.0 / tau, dtype=float)
+    np.exp(out, out=out)
+    out *= A
+    out += C
+    return out
 
 def linear(x, a, b):
     """线性函数"""
     return a * x + b
 
 def polynomial(x, *coeffs):
-    """多项式"""
-    return sum(c * x**i for i, c in enumerate(coeffs))
+    """多项式（系数按升幂排列，用Horner法则从最高次项开始累乘）"""
+    acc = np.full_like(x, coeffs[-1], dtype=float)
+    for c in coeffs[-2::-1]:
+        np.multiply(acc, x, out=acc)
+        acc += c
+    return acc
+
+def _make_poly(deg: int):
+    """
+    生成固定阶数的Horner形式多项式函数
+    
+    参数按降幂排列：p(x, c{deg}, ..., c1, c0)，签名中参数个数固定，
+    拟合器可直接识别，也省去了 *coeffs 的解包
+    """
+    args = ", ".join(f"c{i}" for i in range(deg, -1, -1))
+    expr = "(" * deg + f"c{deg}" + "".join(f")*x + c{i}" for i in range(deg - 1, -1, -1))
+    src = f"def poly{deg}(x, {args}):\n    return {expr}\n"
+    namespace = {}
+    exec(src, namespace)
+    return namespace[f"poly{deg}"]
+
+# 2~6阶多项式，模块加载时生成一次
+_POLY = {deg: _make_poly(deg) for deg in range(2, 7)}
 
 def power_law(x, A, n, C):
     """幂律函数"""
-    return A * np.power(np.abs(x) + 1e-10, n) + C
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate("A * exp(n * log(abs(x) + 1e-10)) + C")
+    out = np.absolute(x, dtype=float)
+    out += 1e-10
+    if float(n).is_integer():
+        # 整数指数直接乘方，无需取对数
+        np.power(out, int(n), out=out)
+    else:
+        # 非整数指数：exp(n*log(base))
+        np.log(out, out=out)
+        out *= n
+        np.exp(out, out=out)
+    out *= A
+    out += C
+    return out
+
+# 双高斯第二个峰的临时缓冲区，按数组形状复用
+_SCRATCH = {}
 
 def double_gaussian(x, A1, mu1, sigma1, A2, mu2, sigma2, C):
     """双高斯函数"""
-    return (A1 * np.exp(-(x - mu1)**2 / (2 * sigma1**2)) +
-            A2 * np.exp(-(x - mu2)**2 / (2 * sigma2**2)) + C)
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate("A1 * exp(-(x - mu1)**2 / (2 * sigma1**2)) + "
+                           "A2 * exp(-(x - mu2)**2 / (2 * sigma2**2)) + C")
+    x = np.asarray(x, dtype=float)
+    buf = _SCRATCH.get(x.shape)
+    if buf is None:
+        buf = _SCRATCH[x.shape] = np.empty(x.shape)
+    
+    # 第一个峰直接写入结果数组
+    out = np.subtract(x, mu1)
+    np.square(out, out=out)
+    out *= -0.5 / sigma1**2
+    np.exp(out, out=out)
+    out *= A1
+    
+    # 第二个峰在缓冲区中计算后累加
+    np.subtract(x, mu2, out=buf)
+    np.square(buf, out=buf)
+    buf *= -0.5 / sigma2**2
+    np.exp(buf, out=buf)
+    buf *= A2
+    
+    out += buf
+    out += C
+    return out
+
+
+# ============================================================
+# 解析雅可比矩阵（每列为模型对一个参数的偏导数）
+# ============================================================
+# 提供给 least_squares 后不再需要用数值差分估计导数，
+# 每个迭代步可省去 参数个数 次额外的模型计算
+
+def gaussian_jac(x, A, mu, sigma, C):
+    """高斯函数的雅可比矩阵"""
+    d = x - mu
+    e = np.exp(-d**2 / (2 * sigma**2))
+    return np.column_stack([
+        e,
+        A * e * d / sigma**2,
+        A * e * d**2 / sigma**3,
+        np.ones_like(e),
+    ])
+
+def lorentzian_jac(x, A, x0, gamma, C):
+    """洛伦兹函数的雅可比矩阵"""
+    hw = gamma / 2
+    d = x - x0
+    denom = d**2 + hw**2
+    return np.column_stack([
+        hw**2 / denom,
+        2 * A * hw**2 * d / denom**2,
+        A * hw * d**2 / denom**2,
+        np.ones_like(denom),
+    ])
+
+def exponential_jac(x, A, tau, C):
+    """指数衰减的雅可比矩阵"""
+    e = np.exp(-x / tau)
+    return np.column_stack([
+        e,
+        A * e * x / tau**2,
+        np.ones_like(e),
+    ])
+
+def linear_jac(x, a, b):
+    """线性函数的雅可比矩阵"""
+    return np.column_stack([x, np.ones_like(x, dtype=float)])
+
+def quadratic_jac(x, a, b, c):
+    """二次多项式的雅可比矩阵"""
+    return np.column_stack([x**2, x, np.ones_like(x, dtype=float)])
+
+def power_law_jac(x, A, n, C):
+    """幂律函数的雅可比矩阵"""
+    base = np.abs(x) + 1e-10
+    p = np.power(base, n)
+    return np.column_stack([
+        p,
+        A * p * np.log(base),
+        np.ones_like(p),
+    ])
+
+
+def _cov_from_jac(jac, residuals):
+    """由雅可比矩阵和残差估计参数协方差：(JᵀJ)⁻¹ · Σr² / (m - n)"""
+    m, n = jac.shape
+    return np.linalg.pinv(jac.T @ jac) * float(residuals @ residuals) / max(m - n, 1)
+
+
+def _p0_peak(x, y):
+    """单峰模型（高斯、洛伦兹）的初始参数：振幅、中心、宽度、基线"""
+    i_max = y.argmax()
+    y_max = y[i_max]
+    y_min = y.min()
+    return [y_max - y_min, x[i_max], np.ptp(x) / 10, y_min]
 
 
 FIT_FUNCTIONS = {
     "高斯 (Gaussian)": {
         "func": gaussian,
+        "jac": gaussian_jac,
         "params": ["振幅 A", "中心 μ", "宽度 σ", "基线 C"],
-        "p0_func": lambda x, y: [y.max() - y.min(), x[np.argmax(y)], (x.max()-x.min())/10, y.min()],
+        "p0_func": _p0_peak,
     },
     "洛伦兹 (Lorentzian)": {
         "func": lorentzian,
+        "jac": lorentzian_jac,
         "params": ["振幅 A", "中心 x₀", "半宽 Γ", "基线 C"],
-        "p0_func": lambda x, y: [y.max() - y.min(), x[np.argmax(y)], (x.max()-x.min())/10, y.min()],
+        "p0_func": _p0_peak,
     },
     "指数衰减 (Exponential)": {
         "func": exponential,
+        "jac": exponential_jac,
         "params": ["振幅 A", "时间常数 τ", "基线 C"],
         "p0_func": lambda x, y: [y[0] - y[-1], (x.max()-x.min())/3, y[-1]],
     },
     "线性 (Linear)": {
         "func": linear,
+        "jac": linear_jac,
         "params": ["斜率 a", "截距 b"],
         "p0_func": lambda x, y: [(y[-1]-y[0])/(x[-1]-x[0]), y[0]],
     },
     "二次多项式": {
-        "func": lambda x, a, b, c: a*x**2 + b*x + c,
+        "func": _POLY[2],
+        "jac": quadratic_jac,
         "params": ["a (x²)", "b (x)", "c (常数)"],
         "p0_func": lambda x, y: [0, (y[-1]-y[0])/(x[-1]-x[0]), y[0]],
     },
     "幂律 (Power Law)": {
         "func": power_law,
+        "jac": power_law_jac,
         "params": ["振幅 A", "指数 n", "基线 C"],
         "p0_func": lambda x, y: [y.max(), 1, y.min()],
     },
@@ -112,6 +283,22 @@ class CurveFittingApp(QMainWindow):
         self.x_data = None
         self.y_data = None
         self.fit_result = None
+        
+        # 导入多列数据时各通道的y值，形状为 (通道数, 点数)
+        self.y_channels = None
+        
+        # 坐标轴和图元只在布局（是否显示残差子图）改变时重建
+        self._layout_residual = None
+        self._ax_main = None
+        self._ax_res = None
+        self._scatter = None
+        self._fit_line = None
+        self._res_scatter = None
+        
+        # 标准正态噪声按(数据类型, 点数)缓存，调节噪声幅度时只需缩放
+        self._rng = np.random.default_rng(0)
+        self._noise_cache = {}
+        
         self.init_ui()
         self.generate_sample_data()
     
@@ -229,6 +416,11 @@ class CurveFittingApp(QMainWindow):
         btn_fit.clicked.connect(self.perform_fit)
         fit_layout.addWidget(btn_fit)
         
+        self.btn_fit_batch = QPushButton("📊 批量拟合所有通道")
+        self.btn_fit_batch.setEnabled(False)
+        self.btn_fit_batch.clicked.connect(self.perform_fit_batch)
+        fit_layout.addWidget(self.btn_fit_batch)
+        
         fit_group.setLayout(fit_layout)
         layout.addWidget(fit_group)
         
@@ -281,34 +473,43 @@ class CurveFittingApp(QMainWindow):
         if data_type == 0:  # 高斯峰
             x = np.linspace(-5, 5, 200)
             y = 2.0 * np.exp(-(x - 0.5)**2 / (2 * 0.8**2)) + 0.3
-            y += np.random.randn(len(x)) * noise
+            y += self.standard_noise(data_type, len(x)) * noise
             
         elif data_type == 1:  # 洛伦兹峰
             x = np.linspace(-5, 5, 200)
             gamma = 0.8
             y = 2.0 * (gamma/2)**2 / ((x - 0.5)**2 + (gamma/2)**2) + 0.2
-            y += np.random.randn(len(x)) * noise
+            y += self.standard_noise(data_type, len(x)) * noise
             
         elif data_type == 2:  # 指数衰减
             x = np.linspace(0, 10, 200)
             y = 3.0 * np.exp(-x / 2.5) + 0.5
-            y += np.random.randn(len(x)) * noise
+            y += self.standard_noise(data_type, len(x)) * noise
             
         elif data_type == 3:  # 双峰光谱
             x = np.linspace(400, 700, 300)
             y = (0.8 * np.exp(-((x - 480)**2) / (2 * 20**2)) +
                  1.2 * np.exp(-((x - 580)**2) / (2 * 25**2)) + 0.1)
-            y += np.random.randn(len(x)) * noise
+            y += self.standard_noise(data_type, len(x)) * noise
             
         else:
             return
         
         self.x_data = x
         self.y_data = y
+        self.y_channels = None
+        self.btn_fit_batch.setEnabled(False)
         self.fit_result = None
         self.text_result.clear()
         self.update_plot()
     
+    def standard_noise(self, key, n: int) -> np.ndarray:
+        """获取缓存的标准正态噪声序列（同一数据类型始终使用同一组噪声）"""
+        z = self._noise_cache.get((key, n))
+        if z is None:
+            z = self._noise_cache[(key, n)] = self._rng.standard_normal(n)
+        return z
+    
     def import_data(self):
         """导入数据"""
         filename, _ = QFileDialog.getOpenFileName(
@@ -318,8 +519,13 @@ class CurveFittingApp(QMainWindow):
         if filename:
             try:
                 data = np.loadtxt(filename, delimiter=',', skiprows=1)
-                self.x_data = data[:, 0]
-                self.y_data = data[:, 1]
+                # 按列切片得到的是跨步视图，拟合时模型会被反复调用，
+                # 先复制成连续的float64数组
+                self.x_data = np.ascontiguousarray(data[:, 0], dtype=float)
+                # 多于两列时其余各列都作为通道，按 (通道数, 点数) 存放
+                self.y_channels = np.ascontiguousarray(data[:, 1:].T, dtype=float)
+                self.y_data = self.y_channels[0]
+                self.btn_fit_batch.setEnabled(len(self.y_channels) > 1)
                 self.fit_result = None
                 self.text_result.clear()
                 self.update_plot()
@@ -339,17 +545,30 @@ class CurveFittingApp(QMainWindow):
             return
         
         try:
+            func = func_info["func"]
+            jac = func_info.get("jac")
+            x = self.x_data
+            y = self.y_data
+            
             # 获取初始参数
-            p0 = func_info["p0_func"](self.x_data, self.y_data)
+            p0 = np.asarray(func_info["p0_func"](x, y), dtype=float)
             
-            # 执行拟合
-            popt, pcov = curve_fit(
-                func_info["func"], 
-                self.x_data, 
-                self.y_data, 
-                p0=p0,
-                maxfev=5000
+            # 执行拟合（直接调用least_squares，跳过curve_fit的参数检查和包装）
+            res = least_squares(
+                lambda p: func(x, *p) - y,
+                p0,
+                jac=(lambda p: jac(x, *p)) if jac is not None else '2-point',
+                method='lm',
+                x_scale='jac',
+                ftol=1e-5,
+                xtol=1e-5,
+                max_nfev=5000
             )
+            if not res.success:
+                raise RuntimeError(res.message)
+            
+            popt = res.x
+            pcov = _cov_from_jac(res.jac, res.fun)
             
             # 计算误差
             perr = np.sqrt(np.diag(pcov))
@@ -357,13 +576,15 @@ class CurveFittingApp(QMainWindow):
             # 计算拟合值
             y_fit = func_info["func"](self.x_data, *popt)
             
-            # 计算R²
-            ss_res = np.sum((self.y_data - y_fit)**2)
-            ss_tot = np.sum((self.y_data - np.mean(self.y_data))**2)
+            # 残差平方和只算一次，R²和卡方共用
+            residuals = self.y_data - y_fit
+            ss_res = float(residuals @ residuals)
+            dy = self.y_data - self.y_data.mean()
+            ss_tot = float(dy @ dy)
             r_squared = 1 - ss_res / ss_tot
             
             # 计算卡方
-            chi_squared = np.sum((self.y_data - y_fit)**2) / len(self.y_data)
+            chi_squared = ss_res / len(self.y_data)
             
             # 存储结果
             self.fit_result = {
@@ -373,7 +594,7 @@ class CurveFittingApp(QMainWindow):
                 "y_fit": y_fit,
                 "r_squared": r_squared,
                 "chi_squared": chi_squared,
-                "residuals": self.y_data - y_fit
+                "residuals": residuals
             }
             
             # 显示结果
@@ -383,6 +604,94 @@ class CurveFittingApp(QMainWindow):
         except Exception as e:
             self.text_result.setText(f"拟合失败:\n{str(e)}")
     
+    def perform_fit_batch(self):
+        """
+        一次性拟合所有通道
+        
+        把各通道的残差拼成一个长向量交给 least_squares，雅可比矩阵
+        为分块对角（各通道参数互不相关），只需一次求解器调用
+        """
+        if self.y_channels is None:
+            return
+        
+        func_name = self.combo_func.currentText()
+        func_info = FIT_FUNCTIONS.get(func_name)
+        
+        if not func_info:
+            return
+        
+        func = func_info["func"]
+        jac = func_info.get("jac")
+        x = self.x_data
+        Y = self.y_channels
+        n_channels, n_points = Y.shape
+        
+        try:
+            p0 = np.concatenate([func_info["p0_func"](x, y) for y in Y]).astype(float)
+            n_params = len(p0) // n_channels
+            
+            def residuals(p):
+                params = p.reshape(n_channels, n_params)
+                return np.concatenate([func(x, *pc) - y for pc, y in zip(params, Y)])
+            
+            if jac is not None:
+                def jacobian(p):
+                    params = p.reshape(n_channels, n_params)
+                    return block_diag([jac(x, *pc) for pc in params], format='csr')
+                options = {"jac": jacobian}
+            else:
+                sparsity = block_diag([np.ones((n_points, n_params))] * n_channels)
+                options = {"jac_sparsity": sparsity}
+            
+            res = least_squares(residuals, p0, method='trf', x_scale='jac',
+                                ftol=1e-5, xtol=1e-5, max_nfev=5000, **options)
+            
+            popts = res.x.reshape(n_channels, n_params)
+            res_all = res.fun.reshape(n_channels, n_points)
+            J = res.jac.tocsr() if hasattr(res.jac, "tocsr") else res.jac
+            
+            perrs = []
+            text = f"═══ {func_name} 批量拟合 ({n_channels} 通道) ═══\n"
+            for c in range(n_channels):
+                r = res_all[c]
+                ss_res = float(r @ r)
+                dy = Y[c] - Y[c].mean()
+                r_squared = 1 - ss_res / float(dy @ dy)
+                
+                # 从本通道对应的雅可比分块估计参数误差
+                rows = slice(c * n_points, (c + 1) * n_points)
+                cols = slice(c * n_params, (c + 1) * n_params)
+                Jc = J[rows, cols]
+                Jc = Jc.toarray() if hasattr(Jc, "toarray") else Jc
+                pcov = _cov_from_jac(Jc, r)
+                perr = np.sqrt(np.diag(pcov))
+                perrs.append(perr)
+                
+                text += f"\n通道 {c + 1}  R² = {r_squared:.6f}\n"
+                for name, val, err in zip(func_info["params"], popts[c], perr):
+                    text += f"  {name}: {val:.6g} ± {err:.6g}\n"
+            
+            # 图中显示第一个通道的拟合结果
+            y_fit = func(x, *popts[0])
+            residuals0 = self.y_data - y_fit
+            ss_res0 = float(residuals0 @ residuals0)
+            dy0 = self.y_data - self.y_data.mean()
+            self.fit_result = {
+                "func_name": func_name,
+                "popt": popts[0],
+                "perr": perrs[0],
+                "y_fit": y_fit,
+                "r_squared": 1 - ss_res0 / float(dy0 @ dy0),
+                "chi_squared": ss_res0 / n_points,
+                "residuals": residuals0
+            }
+            
+            self.text_result.setText(text)
+            self.update_plot()
+            
+        except Exception as e:
+            self.text_result.setText(f"拟合失败:\n{str(e)}")
+    
     def display_results(self, param_names: list):
         """显示拟合结果"""
         if not self.fit_result:
@@ -407,50 +716,88 @@ class CurveFittingApp(QMainWindow):
         
         self.text_result.setText(text)
     
-    def update_plot(self):
-        """更新图形"""
-        if self.x_data is None:
-            return
-        
+    def build_axes(self, show_residual: bool):
+        """创建坐标轴和（空的）图元，之后只更新数据"""
         self.canvas.fig.clear()
         
-        show_residual = self.check_show_residual.isChecked() and self.fit_result
-        
         if show_residual:
             gs = self.canvas.fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.1)
             ax_main = self.canvas.fig.add_subplot(gs[0])
             ax_res = self.canvas.fig.add_subplot(gs[1], sharex=ax_main)
         else:
             ax_main = self.canvas.fig.add_subplot(111)
+            ax_res = None
         
-        # 绑制数据点
-        ax_main.scatter(self.x_data, self.y_data, c='#3498db', s=20, alpha=0.6, label='数据')
-        
-        # 绑制拟合曲线
-        if self.fit_result:
-            ax_main.plot(self.x_data, self.fit_result['y_fit'], 'r-', 
-                        linewidth=2, label=f"拟合 (R²={self.fit_result['r_squared']:.4f})")
+        # 数据点和拟合曲线
+        self._scatter = ax_main.scatter([], [], c='#3498db', s=20, alpha=0.6, label='数据')
+        self._fit_line, = ax_main.plot([], [], 'r-', linewidth=2)
         
         ax_main.set_ylabel('y', fontsize=12)
         ax_main.set_title('曲线拟合', fontsize=14)
-        ax_main.legend(loc='best')
         ax_main.grid(True, alpha=0.3)
         
         if show_residual:
-            ax_main.set_xticklabels([])
+            ax_main.tick_params(labelbottom=False)
             
-            # 绑制残差
-            ax_res.scatter(self.x_data, self.fit_result['residuals'], 
-                          c='#27ae60', s=15, alpha=0.6)
+            # 残差
+            self._res_scatter = ax_res.scatter([], [], c='#27ae60', s=15, alpha=0.6)
             ax_res.axhline(y=0, color='gray', linestyle='--', linewidth=1)
             ax_res.set_xlabel('x', fontsize=12)
             ax_res.set_ylabel('残差', fontsize=10)
             ax_res.grid(True, alpha=0.3)
         else:
+            self._res_scatter = None
             ax_main.set_xlabel('x', fontsize=12)
         
-        self.canvas.fig.tight_layout()
-        self.canvas.draw()
+        self._ax_main = ax_main
+        self._ax_res = ax_res
+        self._layout_residual = show_residual
+    
+    @staticmethod
+    def autoscale(ax, offsets):
+        """按可见曲线和散点重新计算坐标范围（relim不包含散点，需单独加入）"""
+        ax.relim(visible_only=True)
+        ax.update_datalim(offsets)
+        ax.autoscale_view()
+    
+    def update_plot(self):
+        """更新图形"""
+        if self.x_data is None:
+            return
+        
+        show_residual = bool(self.check_show_residual.isChecked() and self.fit_result)
+        rebuilt = show_residual != self._layout_residual
+        if rebuilt:
+            self.build_axes(show_residual)
+        
+        ax_main = self._ax_main
+        
+        # 更新数据点
+        offsets = np.column_stack([self.x_data, self.y_data])
+        self._scatter.set_offsets(offsets)
+        handles = [self._scatter]
+        
+        # 更新拟合曲线
+        if self.fit_result:
+            self._fit_line.set_data(self.x_data, self.fit_result['y_fit'])
+            self._fit_line.set_label(f"拟合 (R²={self.fit_result['r_squared']:.4f})")
+            self._fit_line.set_visible(True)
+            handles.append(self._fit_line)
+        else:
+            self._fit_line.set_visible(False)
+        
+        ax_main.legend(handles=handles, loc='best')
+        self.autoscale(ax_main, offsets)
+        
+        if show_residual:
+            res_offsets = np.column_stack([self.x_data, self.fit_result['residuals']])
+            self._res_scatter.set_offsets(res_offsets)
+            self.autoscale(self._ax_res, res_offsets)
+        
+        # 布局只在重建坐标轴后计算一次
+        if rebuilt:
+            self.canvas.fig.tight_layout()
+        self.canvas.draw_idle()
     
     def export_results(self):
         """导出结果"""
@@ -469,10 +816,10 @@ class CurveFittingApp(QMainWindow):
                     f.write(self.text_result.toPlainText())
                     f.write("\n\n原始数据和拟合值:\n")
                     f.write("x, y_data, y_fit, residual\n")
-                    for x, y, yf, r in zip(self.x_data, self.y_data, 
-                                           self.fit_result['y_fit'],
-                                           self.fit_result['residuals']):
-                        f.write(f"{x:.6g}, {y:.6g}, {yf:.6g}, {r:.6g}\n")
+                    np.savetxt(f, np.column_stack([
+                        self.x_data, self.y_data,
+                        self.fit_result['y_fit'], self.fit_result['residuals']
+                    ]), fmt="%.6g", delimiter=", ")
                 
                 from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.information(self, "导出成功", f"结果已保存到:\n{filename}")
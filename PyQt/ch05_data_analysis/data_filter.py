@@ -15,21 +15,28 @@
 """
 
 import sys
+from functools import lru_cache
 import numpy as np
-from scipy.signal import savgol_filter, butter, filtfilt
-from scipy.ndimage import uniform_filter1d
+from scipy.signal import savgol_filter, butter, sosfiltfilt
+from scipy.ndimage import uniform_filter1d, median_filter
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QGroupBox, QFormLayout,
     QSpinBox, QDoubleSpinBox, QCheckBox, QSlider
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
 
+@lru_cache(maxsize=32)
+def _butter_lowpass_sos(order: int, cutoff: float):
+    """巴特沃斯低通滤波器的二阶节(SOS)系数（按阶数和截止频率缓存）"""
+    return butter(order, cutoff, btype='low', output='sos')
+
+
 class MplCanvas(FigureCanvas):
     """Matplotlib画布"""
     
@@ -46,6 +53,25 @@ class DataFilterDemo(QMainWindow):
         self.raw_data = None
         self.x_data = None
         self.filtered_data = None
+        
+        # 标准正态噪声按(信号类型, 点数)缓存，调节噪声幅度时只需缩放
+        self._rng = np.random.default_rng(0)
+        self._noise_cache = {}
+        
+        # 坐标轴和曲线只在布局（是否显示差异子图）改变时重建
+        self._layout_diff = None
+        self._ax_main = None
+        self._ax_diff = None
+        self._raw_line = None
+        self._filt_line = None
+        self._diff_line = None
+        
+        # 参数连续变化（按住微调按钮）时合并为一次滤波
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(50)
+        self._debounce.timeout.connect(self.apply_filter)
+        
         self.init_ui()
         self.generate_sample_data()
     
@@ -168,20 +194,20 @@ class DataFilterDemo(QMainWindow):
         self.spin_window.setRange(3, 51)
         self.spin_window.setValue(11)
         self.spin_window.setSingleStep(2)
-        self.spin_window.valueChanged.connect(self.apply_filter)
+        self.spin_window.valueChanged.connect(self.schedule_filter)
         param_layout.addRow("窗口大小:", self.spin_window)
         
         self.spin_order = QSpinBox()
         self.spin_order.setRange(1, 10)
         self.spin_order.setValue(3)
-        self.spin_order.valueChanged.connect(self.apply_filter)
+        self.spin_order.valueChanged.connect(self.schedule_filter)
         param_layout.addRow("阶数/多项式:", self.spin_order)
         
         self.spin_cutoff = QDoubleSpinBox()
         self.spin_cutoff.setRange(0.01, 0.5)
         self.spin_cutoff.setValue(0.1)
         self.spin_cutoff.setSingleStep(0.01)
-        self.spin_cutoff.valueChanged.connect(self.apply_filter)
+        self.spin_cutoff.valueChanged.connect(self.schedule_filter)
         param_layout.addRow("截止频率:", self.spin_cutoff)
         
         filter_layout.addLayout(param_layout)
@@ -238,6 +264,10 @@ class DataFilterDemo(QMainWindow):
         
         return panel
     
+    def schedule_filter(self):
+        """参数改变后延迟滤波，连续变化时只执行最后一次"""
+        self._debounce.start()
+    
     def update_filter_params(self):
         """根据滤波方法更新参数可用性"""
         filter_type = self.combo_filter.currentIndex()
@@ -270,7 +300,7 @@ class DataFilterDemo(QMainWindow):
         elif signal_type == 2:  # 阶跃
             clean = np.zeros(n)
             clean[n//4:3*n//4] = 1
-            clean = np.convolve(clean, np.ones(10)/10, mode='same')  # 平滑边缘
+            clean = uniform_filter1d(clean, size=10)  # 平滑边缘
             
         else:  # 光谱峰 + 基线漂移
             x = self.x_data
@@ -279,17 +309,26 @@ class DataFilterDemo(QMainWindow):
                     0.05 * x)  # 基线漂移
         
         # 添加噪声
-        self.raw_data = clean + np.random.randn(n) * noise_level
+        clean += self.standard_noise(signal_type, n) * noise_level
+        self.raw_data = clean
         self.filtered_data = self.raw_data.copy()
         
         self.apply_filter()
     
+    def standard_noise(self, key, n: int) -> np.ndarray:
+        """获取缓存的标准正态噪声序列（同一信号始终使用同一组噪声）"""
+        z = self._noise_cache.get((key, n))
+        if z is None:
+            z = self._noise_cache[(key, n)] = self._rng.standard_normal(n)
+        return z
+    
     def apply_filter(self):
         """应用滤波"""
         if self.raw_data is None:
             return
         
-        data = self.raw_data.copy()
+        # 不预先复制：异常值去除和各滤波方法都会返回新数组
+        data = self.raw_data
         
         # 1. 去除异常值
         if self.check_outliers.isChecked():
@@ -312,21 +351,25 @@ class DataFilterDemo(QMainWindow):
         elif filter_type == 3:  # 巴特沃斯低通
             cutoff = self.spin_cutoff.value()
             order = self.spin_order.value()
-            b, a = butter(order, cutoff, btype='low')
-            data = filtfilt(b, a, data)
+            # 二阶节形式在高阶时数值更稳定
+            sos = _butter_lowpass_sos(order, cutoff)
+            data = sosfiltfilt(sos, data)
             
         elif filter_type == 4:  # 中值滤波
-            from scipy.ndimage import median_filter
             window = self.spin_window.value()
             data = median_filter(data, size=window)
         
+        # data已是新数组时后续步骤原地计算，仍是原始数据时写入新数组
+        out = None if data is self.raw_data else data
+        
         # 3. 基线校正
         if self.check_baseline.isChecked():
-            data = self.baseline_correction(data)
+            data = self.baseline_correction(data, out=out)
+            out = data
         
         # 4. 归一化
         if self.check_normalize.isChecked():
-            data = self.normalize(data)
+            data = self.normalize(data, out=out)
         
         self.filtered_data = data
         self.update_stats()
@@ -334,32 +377,50 @@ class DataFilterDemo(QMainWindow):
     
     def remove_outliers(self, data: np.ndarray, threshold: float = 3) -> np.ndarray:
         """使用Z-score方法去除异常值"""
-        z_scores = np.abs((data - np.mean(data)) / np.std(data))
-        mask = z_scores < threshold
+        # |data - mean| 与 threshold*std 比较，避免逐点除法
+        dev = data - data.mean()
+        np.abs(dev, out=dev)
+        outliers = dev > threshold * data.std()
+        if not outliers.any():
+            return data
+        
         # 用插值替换异常值
+        good = ~outliers
         result = data.copy()
-        result[~mask] = np.interp(
-            np.where(~mask)[0],
-            np.where(mask)[0],
-            data[mask]
+        result[outliers] = np.interp(
+            np.flatnonzero(outliers),
+            np.flatnonzero(good),
+            data[good]
         )
         return result
     
-    def baseline_correction(self, data: np.ndarray) -> np.ndarray:
-        """多项式基线校正"""
-        x = np.arange(len(data))
-        # 使用端点拟合基线
-        coeffs = np.polyfit(x, data, 1)
-        baseline = np.polyval(coeffs, x)
-        return data - baseline
+    def baseline_correction(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """多项式基线校正（out可与data相同，即原地校正）"""
+        # 线性最小二乘拟合基线（闭式解）
+        # x = 0..n-1，Σx 与 Σx² 直接用求和公式
+        n = len(data)
+        x = np.arange(n, dtype=float)
+        sx = n * (n - 1) / 2
+        sxx = (n - 1) * n * (2 * n - 1) / 6
+        sy = data.sum()
+        sxy = x @ data
+        slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        intercept = (sy - slope * sx) / n
+        
+        # 基线直接写回x数组
+        x *= slope
+        x += intercept
+        return np.subtract(data, x, out=out)
     
-    def normalize(self, data: np.ndarray) -> np.ndarray:
-        """归一化到[0, 1]"""
+    def normalize(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """归一化到[0, 1]（out可与data相同，即原地归一化）"""
         min_val = np.min(data)
         max_val = np.max(data)
         if max_val - min_val < 1e-10:
             return data
-        return (data - min_val) / (max_val - min_val)
+        out = np.subtract(data, min_val, out=out)
+        out *= 1.0 / (max_val - min_val)
+        return out
     
     def update_stats(self):
         """更新统计信息"""
@@ -376,47 +437,73 @@ class DataFilterDemo(QMainWindow):
         
         self.label_stats.setText(stats)
     
-    def update_plot(self):
-        """更新图形"""
+    def build_axes(self, show_diff: bool):
+        """创建坐标轴和（空的）曲线，之后只更新曲线数据"""
         self.canvas.fig.clear()
         
-        show_diff = self.check_show_diff.isChecked()
-        
         if show_diff:
             gs = self.canvas.fig.add_gridspec(2, 1, height_ratios=[3, 1], hspace=0.1)
             ax_main = self.canvas.fig.add_subplot(gs[0])
             ax_diff = self.canvas.fig.add_subplot(gs[1], sharex=ax_main)
         else:
             ax_main = self.canvas.fig.add_subplot(111)
+            ax_diff = None
         
         # 主图
-        if self.check_show_raw.isChecked():
-            ax_main.plot(self.x_data, self.raw_data, 'b-', alpha=0.3, 
-                        linewidth=0.8, label='原始数据')
-        
-        ax_main.plot(self.x_data, self.filtered_data, 'r-', 
-                    linewidth=1.5, label='滤波后')
-        
-        filter_name = self.combo_filter.currentText()
-        ax_main.set_title(f'数据滤波 - {filter_name}', fontsize=14)
+        self._raw_line, = ax_main.plot([], [], 'b-', alpha=0.3,
+                                       linewidth=0.8, label='原始数据')
+        self._filt_line, = ax_main.plot([], [], 'r-',
+                                        linewidth=1.5, label='滤波后')
         ax_main.set_ylabel('振幅', fontsize=12)
-        ax_main.legend(loc='best')
         ax_main.grid(True, alpha=0.3)
         
         if show_diff:
-            ax_main.set_xticklabels([])
+            ax_main.tick_params(labelbottom=False)
             
-            diff = self.raw_data - self.filtered_data
-            ax_diff.plot(self.x_data, diff, 'g-', linewidth=0.8)
+            self._diff_line, = ax_diff.plot([], [], 'g-', linewidth=0.8)
             ax_diff.axhline(y=0, color='gray', linestyle='--', linewidth=0.5)
             ax_diff.set_xlabel('x', fontsize=12)
             ax_diff.set_ylabel('差异', fontsize=10)
             ax_diff.grid(True, alpha=0.3)
         else:
+            self._diff_line = None
             ax_main.set_xlabel('x', fontsize=12)
         
-        self.canvas.fig.tight_layout()
-        self.canvas.draw()
+        self._ax_main = ax_main
+        self._ax_diff = ax_diff
+        self._layout_diff = show_diff
+    
+    def update_plot(self):
+        """更新图形"""
+        show_diff = self.check_show_diff.isChecked()
+        rebuilt = show_diff != self._layout_diff
+        if rebuilt:
+            self.build_axes(show_diff)
+        
+        ax_main = self._ax_main
+        show_raw = self.check_show_raw.isChecked()
+        
+        # 主图
+        self._raw_line.set_data(self.x_data, self.raw_data)
+        self._raw_line.set_visible(show_raw)
+        self._filt_line.set_data(self.x_data, self.filtered_data)
+        
+        filter_name = self.combo_filter.currentText()
+        ax_main.set_title(f'数据滤波 - {filter_name}', fontsize=14)
+        handles = [self._raw_line, self._filt_line] if show_raw else [self._filt_line]
+        ax_main.legend(handles=handles, loc='best')
+        ax_main.relim(visible_only=True)
+        ax_main.autoscale_view()
+        
+        if show_diff:
+            self._diff_line.set_data(self.x_data, self.raw_data - self.filtered_data)
+            self._ax_diff.relim()
+            self._ax_diff.autoscale_view()
+        
+        # 布局只在重建坐标轴后计算一次
+        if rebuilt:
+            self.canvas.fig.tight_layout()
+        self.canvas.draw_idle()
 
 
 def main():
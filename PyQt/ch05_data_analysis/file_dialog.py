@@ -15,13 +15,102 @@
 
 import sys
 import os
+import tempfile
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QGroupBox, QFormLayout,
-    QFileDialog, QMessageBox, QListWidget
+    QPushButton, QLabel, QPlainTextEdit, QGroupBox, QFormLayout,
+    QFileDialog, QMessageBox, QListWidget, QProgressBar, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
+
+# 可选：pandas 的C解析器读取大CSV文件比 np.loadtxt 快得多
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# 可选：pyarrow 提供多线程CSV解析，并支持导出为Parquet格式（体积更小、写入更快）
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# 小于该大小的文件 np.loadtxt 已足够快，超过时改用 pandas
+PANDAS_MIN_SIZE = 1 << 20
+
+# 导入时先同步解析的预览行数，完整数据在后台线程中读取
+PREVIEW_ROWS = 1000
+
+# 超过该大小的完整数据写入临时 .npy 文件，以内存映射方式持有
+MEMMAP_MIN_BYTES = 256 << 20
+
+# 目录中视为数据文件的扩展名（小写）
+DATA_EXTENSIONS = frozenset({'.csv', '.txt', '.dat'})
+
+# 模拟光谱的高斯峰参数：中心(nm)、宽度(nm)、幅度
+PEAK_CENTERS = np.array([450.0, 520.0, 600.0])
+PEAK_WIDTHS = np.array([15.0, 20.0, 25.0])
+PEAK_AMPLITUDES = np.array([0.8, 1.0, 0.6])
+
+
+def load_csv(filename: str, nrows: int = None, dtype=np.float64) -> np.ndarray:
+    """读取带一行表头的数值CSV文件，返回二维数组（nrows限制读取行数）"""
+    use_pandas = PANDAS_AVAILABLE and os.path.getsize(filename) >= PANDAS_MIN_SIZE
+    with open(filename, 'r', encoding='utf-8') as f:
+        # 先用 readline 读掉表头（同时得到列数），再把已定位的文件对象交给解析器，
+        # 不再让解析器用 skiprows 重新扫描跳过的行
+        ncols = f.readline().count(',') + 1
+        if use_pandas:
+            if PYARROW_AVAILABLE and nrows is None:
+                # 完整读取时用 pyarrow 多线程解析（该引擎不支持 nrows）
+                return pd.read_csv(f, header=None, dtype=dtype,
+                                   engine='pyarrow').to_numpy()
+            return pd.read_csv(f, header=None, nrows=nrows,
+                               dtype=dtype, engine='c').to_numpy()
+        # 显式指定 usecols 让解析器走全浮点快速路径
+        return np.loadtxt(f, delimiter=',', max_rows=nrows,
+                          dtype=dtype, usecols=range(ncols), ndmin=2)
+
+
+def to_memmap(data: np.ndarray):
+    """把数组写入临时 .npy 文件，返回 (只读内存映射, 文件路径)"""
+    fd, path = tempfile.mkstemp(suffix='.npy')
+    with os.fdopen(fd, 'wb') as f:
+        np.save(f, data)
+    return np.load(path, mmap_mode='r'), path
+
+
+class CsvLoadWorker(QThread):
+    """
+    CSV读取工作线程
+    
+    大文件完整解析可能耗时数秒，放到后台执行；
+    界面先显示预览行，读取完成后再替换为完整数据。
+    """
+    
+    result = pyqtSignal(object, str)   # 完整数据, 内存映射文件路径（未映射时为空）
+    error = pyqtSignal(str)            # 错误
+    
+    def __init__(self, filename: str, dtype=np.float64):
+        super().__init__()
+        self.filename = filename
+        self.dtype = dtype
+    
+    def run(self):
+        """读取完整文件"""
+        try:
+            data = load_csv(self.filename, dtype=self.dtype)
+            path = ""
+            if data.nbytes >= MEMMAP_MIN_BYTES:
+                # 大数组落盘后只保留映射，常驻内存由操作系统页缓存管理
+                data, path = to_memmap(data)
+            self.result.emit(data, path)
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class FileDialogDemo(QMainWindow):
@@ -30,6 +119,8 @@ class FileDialogDemo(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_data = None
+        self.memmap_path = ""
+        self.load_worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -62,6 +153,10 @@ class FileDialogDemo(QMainWindow):
         btn_open_csv.clicked.connect(self.import_csv)
         open_layout.addWidget(btn_open_csv)
         
+        # 预览/统计只需4位有效数字，float32 可使内存减半
+        self.check_float32 = QCheckBox("以float32读取（内存减半）")
+        open_layout.addWidget(self.check_float32)
+        
         open_group.setLayout(open_layout)
         left_layout.addWidget(open_group)
         
@@ -119,10 +214,11 @@ class FileDialogDemo(QMainWindow):
         # 数据预览
         data_group = QGroupBox("数据预览")
         data_layout = QVBoxLayout()
-        self.text_preview = QTextEdit()
+        # 纯文本等宽预览，QPlainTextEdit 比富文本的 QTextEdit 排版和绘制开销小
+        self.text_preview = QPlainTextEdit()
         self.text_preview.setReadOnly(True)
         self.text_preview.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: Consolas, monospace;
                 font-size: 12px;
             }
@@ -136,6 +232,12 @@ class FileDialogDemo(QMainWindow):
         self.label_status.setStyleSheet("color: #27ae60; padding: 5px;")
         right_layout.addWidget(self.label_status)
         
+        # 后台读取进度（不确定模式）
+        self.progress_load = QProgressBar()
+        self.progress_load.setRange(0, 0)
+        self.progress_load.setVisible(False)
+        right_layout.addWidget(self.progress_load)
+        
         main_layout.addLayout(right_layout)
         
         # 样式
@@ -191,18 +293,21 @@ class FileDialogDemo(QMainWindow):
         )
         
         if filenames:
-            self.list_files.clear()
-            for filename in filenames:
-                self.list_files.addItem(filename)
+            self.set_file_list(filenames)
             
-            self.text_preview.setText(f"选择了 {len(filenames)} 个文件:\n")
-            for f in filenames:
-                self.text_preview.append(f"  • {os.path.basename(f)}")
+            # 先拼好全部文本，只设置一次（逐行 append 每次都会重新排版）
+            lines = [f"选择了 {len(filenames)} 个文件:", ""]
+            lines.extend(f"  • {os.path.basename(f)}" for f in filenames)
+            self.text_preview.setPlainText("\n".join(lines))
             
             self.set_status(f"选择了 {len(filenames)} 个文件")
     
     def import_csv(self):
         """导入CSV数据"""
+        if self.load_worker is not None:
+            QMessageBox.warning(self, "警告", "正在读取文件，请稍候")
+            return
+        
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "导入CSV数据",
@@ -211,41 +316,92 @@ class FileDialogDemo(QMainWindow):
         )
         
         if filename:
+            dtype = np.float32 if self.check_float32.isChecked() else np.float64
             try:
-                # 尝试加载数据
-                self.current_data = np.loadtxt(filename, delimiter=',', skiprows=1)
-                
-                rows, cols = self.current_data.shape
-                
-                # 显示预览
-                preview = f"文件: {os.path.basename(filename)}\n"
-                preview += f"形状: {rows} 行 × {cols} 列\n"
-                preview += "-" * 40 + "\n"
-                preview += "数据预览 (前10行):\n"
-                
-                for i in range(min(10, rows)):
-                    row_str = "  ".join(f"{v:10.4g}" for v in self.current_data[i])
-                    preview += f"{i+1:3d}: {row_str}\n"
-                
-                if rows > 10:
-                    preview += f"  ... 还有 {rows - 10} 行\n"
-                
-                preview += "-" * 40 + "\n"
-                preview += f"统计信息:\n"
-                for j in range(cols):
-                    col_data = self.current_data[:, j]
-                    preview += f"  列{j+1}: 最小={col_data.min():.4g}, "
-                    preview += f"最大={col_data.max():.4g}, "
-                    preview += f"平均={col_data.mean():.4g}\n"
-                
-                self.text_preview.setText(preview)
-                self.list_files.clear()
-                self.list_files.addItem(filename)
-                self.set_status(f"成功导入 {rows}×{cols} 数据矩阵")
-                
+                # 先只解析前若干行，界面立即显示预览
+                preview_data = load_csv(filename, nrows=PREVIEW_ROWS, dtype=dtype)
+                if preview_data.size == 0:
+                    raise ValueError("文件中没有数据")
+                self.show_csv_preview(filename, preview_data,
+                                      complete=len(preview_data) < PREVIEW_ROWS)
             except Exception as e:
                 QMessageBox.critical(self, "导入错误", f"无法导入文件:\n{str(e)}")
                 self.set_status("导入失败", error=True)
+                return
+            
+            # 新文件确认可用后再释放之前的数据
+            self.release_data()
+            self.list_files.clear()
+            self.list_files.addItem(filename)
+            
+            if len(preview_data) < PREVIEW_ROWS:
+                # 文件已完整读入，无需后台线程
+                self.current_data = preview_data
+                rows, cols = preview_data.shape
+                self.set_status(f"成功导入 {rows}×{cols} 数据矩阵")
+                return
+            
+            # 后台读取完整数据
+            self.set_status("正在读取完整数据...")
+            self.progress_load.setVisible(True)
+            self.load_worker = CsvLoadWorker(filename, dtype)
+            self.load_worker.result.connect(
+                lambda data, path: self.on_csv_loaded(filename, data, path))
+            self.load_worker.error.connect(self.on_csv_error)
+            self.load_worker.finished.connect(self.on_load_finished)
+            self.load_worker.start()
+    
+    def show_csv_preview(self, filename: str, data: np.ndarray, complete: bool = True):
+        """显示CSV数据预览与统计信息"""
+        rows, cols = data.shape
+        
+        # 逐行收集到列表，最后一次拼接（避免字符串反复 += 复制）
+        lines = [f"文件: {os.path.basename(filename)}"]
+        if complete:
+            lines.append(f"形状: {rows} 行 × {cols} 列")
+        else:
+            lines.append(f"形状: ≥{rows} 行 × {cols} 列 (正在读取完整数据)")
+        lines.append("-" * 40)
+        lines.append("数据预览 (前10行):")
+        
+        # np.char.mod 在C层逐元素格式化，避免每个数值一次Python格式化调用
+        formatted = np.char.mod('%10.4g', data[:10])
+        lines.extend(f"{i+1:3d}: {'  '.join(row)}" for i, row in enumerate(formatted))
+        
+        if rows > 10 and complete:
+            lines.append(f"  ... 还有 {rows - 10} 行")
+        
+        lines.append("-" * 40)
+        lines.append("统计信息:" if complete else f"统计信息 (前{rows}行):")
+        # 沿 axis=0 一次性求出各列统计量，避免逐列调用
+        mins = data.min(axis=0)
+        maxs = data.max(axis=0)
+        means = data.mean(axis=0, dtype=np.float64)  # float32 数据也用双精度累加
+        lines.extend(
+            f"  列{j+1}: 最小={mins[j]:.4g}, 最大={maxs[j]:.4g}, 平均={means[j]:.4g}"
+            for j in range(cols)
+        )
+        
+        self.text_preview.setPlainText("\n".join(lines))
+    
+    def on_csv_loaded(self, filename: str, data: np.ndarray, memmap_path: str = ""):
+        """完整数据读取完成"""
+        self.current_data = data
+        self.memmap_path = memmap_path
+        self.show_csv_preview(filename, data)
+        rows, cols = data.shape
+        self.set_status(f"成功导入 {rows}×{cols} 数据矩阵")
+    
+    def on_csv_error(self, message: str):
+        """后台读取出错"""
+        QMessageBox.critical(self, "导入错误", f"无法导入文件:\n{message}")
+        self.set_status("导入失败", error=True)
+    
+    def on_load_finished(self):
+        """读取线程结束"""
+        self.progress_load.setVisible(False)
+        self.load_worker.wait()
+        self.load_worker = None
     
     def save_file(self):
         """保存文件"""
@@ -274,21 +430,33 @@ class FileDialogDemo(QMainWindow):
             QMessageBox.warning(self, "警告", "没有数据可导出。\n请先导入数据或生成测试数据。")
             return
         
+        file_filter = "CSV文件 (*.csv)"
+        if PANDAS_AVAILABLE and PYARROW_AVAILABLE:
+            file_filter += ";;Parquet文件 (*.parquet)"
+        
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "导出CSV",
             "data.csv",
-            "CSV文件 (*.csv)"
+            file_filter
         )
         
         if filename:
             try:
                 # 生成表头
                 cols = self.current_data.shape[1]
-                header = ",".join(f"Col{i+1}" for i in range(cols))
+                columns = [f"Col{i+1}" for i in range(cols)]
                 
-                np.savetxt(filename, self.current_data, delimiter=',', 
-                          header=header, comments='')
+                if PANDAS_AVAILABLE:
+                    # pandas 的C格式化器比 np.savetxt 的逐元素格式化快得多
+                    df = pd.DataFrame(self.current_data, columns=columns, copy=False)
+                    if filename.lower().endswith('.parquet'):
+                        df.to_parquet(filename, index=False)
+                    else:
+                        df.to_csv(filename, index=False, chunksize=100_000)
+                else:
+                    np.savetxt(filename, self.current_data, delimiter=',',
+                              header=",".join(columns), comments='')
                 
                 self.set_status(f"已导出: {os.path.basename(filename)}")
                 QMessageBox.information(self, "导出成功", f"数据已导出:\n{filename}")
@@ -306,24 +474,29 @@ class FileDialogDemo(QMainWindow):
         )
         
         if folder:
-            # 列出目录中的文件
-            files = os.listdir(folder)
-            data_files = [f for f in files if f.endswith(('.csv', '.txt', '.dat'))]
+            # 列出目录中的文件（scandir 一次遍历即可得到路径和文件信息），
+            # 扩展名只拆分一次并在集合中查找
+            with os.scandir(folder) as it:
+                data_files = [
+                    e for e in it
+                    if os.path.splitext(e.name)[1].lower() in DATA_EXTENSIONS
+                    and e.is_file()
+                ]
             
-            self.list_files.clear()
-            for f in data_files:
-                self.list_files.addItem(os.path.join(folder, f))
+            self.set_file_list([e.path for e in data_files])
             
-            self.text_preview.setText(f"目录: {folder}\n")
-            self.text_preview.append(f"数据文件数量: {len(data_files)}\n")
-            self.text_preview.append("-" * 40)
+            lines = [f"目录: {folder}", "",
+                     f"数据文件数量: {len(data_files)}", "",
+                     "-" * 40]
             
-            for f in data_files[:20]:
-                size = os.path.getsize(os.path.join(folder, f)) / 1024
-                self.text_preview.append(f"  {f} ({size:.1f} KB)")
+            for e in data_files[:20]:
+                size = e.stat().st_size / 1024
+                lines.append(f"  {e.name} ({size:.1f} KB)")
             
             if len(data_files) > 20:
-                self.text_preview.append(f"  ... 还有 {len(data_files) - 20} 个文件")
+                lines.append(f"  ... 还有 {len(data_files) - 20} 个文件")
+            
+            self.text_preview.setPlainText("\n".join(lines))
             
             self.set_status(f"找到 {len(data_files)} 个数据文件")
     
@@ -332,16 +505,19 @@ class FileDialogDemo(QMainWindow):
         # 生成模拟光谱数据
         x = np.linspace(400, 700, 301)  # 波长 400-700 nm
         
-        # 多个高斯峰
-        y = (0.8 * np.exp(-((x - 450)**2) / (2 * 15**2)) +
-             1.0 * np.exp(-((x - 520)**2) / (2 * 20**2)) +
-             0.6 * np.exp(-((x - 600)**2) / (2 * 25**2)))
+        # 多个高斯峰：广播成 (点数, 峰数) 一次计算，再按幅度加权求和
+        z = (x[:, None] - PEAK_CENTERS) / PEAK_WIDTHS
+        y = np.exp(-0.5 * z * z) @ PEAK_AMPLITUDES
         
         # 添加噪声
         y += np.random.randn(len(x)) * 0.05
         
-        # 存储数据
-        self.current_data = np.column_stack([x, y])
+        # 存储数据（直接写入预分配的两列数组，省去 column_stack 的临时拷贝）
+        self.release_data()
+        data = np.empty((x.size, 2))
+        data[:, 0] = x
+        data[:, 1] = y
+        self.current_data = data
         
         # 显示预览
         preview = "生成的测试数据（模拟光谱）:\n"
@@ -357,22 +533,58 @@ class FileDialogDemo(QMainWindow):
         preview += f"波长范围: {x.min():.1f} - {x.max():.1f} nm\n"
         preview += f"强度范围: {y.min():.4f} - {y.max():.4f}\n"
         
-        self.text_preview.setText(preview)
+        self.text_preview.setPlainText(preview)
         self.set_status("已生成测试数据 (301×2)")
     
     def preview_file(self, filename: str):
         """预览文件内容"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                content = f.read(5000)  # 只读取前5000字符
+            # 直接读取前5000字节，跳过文本流的缓冲与解码层
+            fd = os.open(filename, os.O_RDONLY)
+            try:
+                raw = os.read(fd, 5000)
+            finally:
+                os.close(fd)
+            
+            truncated = len(raw) == 5000
+            if truncated:
+                # 截断到最后一个完整行，避免切断多字节字符
+                cut = raw.rfind(b"\n")
+                if cut > 0:
+                    raw = raw[:cut]
             
-            if len(content) == 5000:
-                content += "\n... (文件过大，只显示前5000字符)"
+            content = raw.decode('utf-8', errors='replace')
+            if truncated:
+                content += "\n... (文件过大，只显示前5000字节)"
             
-            self.text_preview.setText(content)
+            self.text_preview.setPlainText(content)
             
         except Exception as e:
-            self.text_preview.setText(f"无法预览文件:\n{str(e)}")
+            self.text_preview.setPlainText(f"无法预览文件:\n{str(e)}")
+    
+    def release_data(self):
+        """释放当前数据，并删除对应的临时内存映射文件"""
+        self.current_data = None
+        if self.memmap_path:
+            try:
+                os.remove(self.memmap_path)
+            except OSError:
+                pass
+            self.memmap_path = ""
+    
+    def closeEvent(self, event):
+        """关闭窗口时清理临时文件"""
+        if self.load_worker is not None:
+            self.load_worker.wait()
+        self.release_data()
+        super().closeEvent(event)
+    
+    def set_file_list(self, paths: list):
+        """一次性替换文件列表（批量插入，只重绘一次）"""
+        self.list_files.setUpdatesEnabled(False)
+        self.list_files.clear()
+        self.list_files.addItems(paths)
+        self.list_files.setUpdatesEnabled(True)
     
     def set_status(self, message: str, error: bool = False):
         """设置状态"""
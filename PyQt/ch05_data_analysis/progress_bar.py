@@ -15,7 +15,6 @@
 """
 
 import sys
-import time
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QProgressBar, QProgressDialog,
@@ -38,15 +37,19 @@ class SimulatedTask(QThread):
     
     def run(self):
         steps = self.duration * 10  # 每秒10步
+        last_progress = -1
         for i in range(steps):
             if self._is_cancelled:
                 self.status.emit("已取消")
                 return
             
+            # 只在百分比变化时发射信号，减少跨线程事件
             progress = int((i + 1) / steps * 100)
-            self.progress.emit(progress)
-            self.status.emit(f"处理中... {progress}%")
-            time.sleep(0.1)
+            if progress != last_progress:
+                last_progress = progress
+                self.progress.emit(progress)
+                self.status.emit(f"处理中... {progress}%")
+            self.msleep(100)
         
         self.status.emit("完成!")
         self.finished.emit()
@@ -68,15 +71,19 @@ class MultiTaskWorker(QThread):
         self.n_tasks = n_tasks
     
     def run(self):
+        last_overall = -1
         for task_idx in range(self.n_tasks):
             self.task_status.emit(task_idx, "进行中")
             
             # 模拟任务执行
             for i in range(100):
                 self.task_progress.emit(task_idx, i + 1)
+                # 总进度每 n_tasks 步才变化一次，未变化时不发射
                 overall = int((task_idx * 100 + i + 1) / (self.n_tasks * 100) * 100)
-                self.overall_progress.emit(overall)
-                time.sleep(0.02)
+                if overall != last_overall:
+                    last_overall = overall
+                    self.overall_progress.emit(overall)
+                self.msleep(20)
             
             self.task_status.emit(task_idx, "完成")
         
@@ -90,6 +97,15 @@ class ProgressBarDemo(QMainWindow):
         super().__init__()
         self.task = None
         self.multi_task = None
+        
+        # 进度对话框由定时器驱动，不在循环中 sleep + processEvents
+        self.progress_dialog = None
+        self._dialog_step = 0
+        self._dialog_steps = 0
+        self._dialog_timer = QTimer(self)
+        self._dialog_timer.setInterval(100)
+        self._dialog_timer.timeout.connect(self._tick_dialog)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -400,27 +416,41 @@ class ProgressBarDemo(QMainWindow):
     
     def show_progress_dialog(self):
         """显示进度对话框"""
+        if self._dialog_timer.isActive():
+            return
+        
         duration = self.spin_dialog_duration.value()
-        steps = duration * 10
+        self._dialog_steps = duration * 10
+        self._dialog_step = 0
         
-        dialog = QProgressDialog("正在处理...", "取消", 0, steps, self)
+        dialog = QProgressDialog("正在处理...", "取消", 0, self._dialog_steps, self)
         dialog.setWindowTitle("进度")
         dialog.setWindowModality(Qt.WindowModality.WindowModal)
         dialog.setMinimumDuration(0)
         dialog.show()
+        self.progress_dialog = dialog
         
-        for i in range(steps):
-            if dialog.wasCanceled():
-                self.statusBar.showMessage("操作已取消", 3000)
-                return
-            
-            dialog.setValue(i + 1)
-            dialog.setLabelText(f"正在处理... ({i+1}/{steps})")
-            QApplication.processEvents()
-            time.sleep(0.1)
-        
-        dialog.close()
-        self.statusBar.showMessage("操作完成", 3000)
+        # 每100ms推进一步，期间事件循环正常运行
+        self._dialog_timer.start()
+    
+    def _tick_dialog(self):
+        """进度对话框定时推进一步"""
+        dialog = self.progress_dialog
+        if dialog.wasCanceled():
+            self._dialog_timer.stop()
+            self.progress_dialog = None
+            self.statusBar.showMessage("操作已取消", 3000)
+            return
+        
+        self._dialog_step += 1
+        dialog.setValue(self._dialog_step)
+        dialog.setLabelText(f"正在处理... ({self._dialog_step}/{self._dialog_steps})")
+        
+        if self._dialog_step >= self._dialog_steps:
+            self._dialog_timer.stop()
+            dialog.close()
+            self.progress_dialog = None
+            self.statusBar.showMessage("操作完成", 3000)
     
     def start_multi_task(self):
         """开始多任务"""
@@ -24,6 +24,30 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QBrush
 
+# 可选：pandas 的C解析器读取CSV比 np.loadtxt 快得多，并保留原始表头
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# 可选：pyarrow 的C++写入器导出CSV比 np.savetxt 的逐元素格式化快得多
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# 高亮与清除高亮使用的画刷，只创建一次
+_WHITE_BRUSH = QBrush(QColor("white"))
+_BLACK_BRUSH = QBrush(QColor("black"))
+_MAX_BG = QBrush(QColor("#ffcccc"))   # 最大值：红色
+_MAX_FG = QBrush(QColor("#c0392b"))
+_MIN_BG = QBrush(QColor("#cce5ff"))   # 最小值：蓝色
+_MIN_FG = QBrush(QColor("#2980b9"))
+
 
 class TableViewDemo(QMainWindow):
     """表格控件演示"""
@@ -31,6 +55,9 @@ class TableViewDemo(QMainWindow):
     def __init__(self):
         super().__init__()
         self.data = None
+        self._highlighted = False
+        self._last_headers = None
+        self._data_edited = False   # 表格内容是否已与 self.data 不一致
         self.init_ui()
         self.generate_sample_data()
     
@@ -173,6 +200,7 @@ class TableViewDemo(QMainWindow):
         
         # 连接选择变化信号
         self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.itemChanged.connect(self.on_item_changed)
         
         # 窗口样式
         self.setStyleSheet("""
@@ -238,19 +266,49 @@ class TableViewDemo(QMainWindow):
         """将NumPy数组加载到表格"""
         rows, cols = data.shape
         
-        self.table.setRowCount(rows)
-        self.table.setColumnCount(cols)
-        self.table.setHorizontalHeaderLabels(headers)
-        
-        for i in range(rows):
-            for j in range(cols):
-                value = data[i, j]
-                item = QTableWidgetItem(f"{value:.6g}")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                self.table.setItem(i, j, item)
-        
+        # 先在C层一次性格式化全部数值，循环中只创建单元格
+        texts = np.char.mod('%.6g', data).tolist()
+        align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        # 形状和表头都未变化时，只需更新单元格文本
+        shape_changed = (self.table.rowCount(), self.table.columnCount()) != (rows, cols)
+        headers_changed = headers != self._last_headers
+        
+        # 复用的单元格会保留旧的高亮，先清除
+        if self._highlighted:
+            self.clear_highlight()
+        
+        # 批量填充期间暂停重绘和信号，结束后统一刷新
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            if shape_changed:
+                self.table.setRowCount(rows)
+                self.table.setColumnCount(cols)
+            if headers_changed:
+                self.table.setHorizontalHeaderLabels(headers)
+                self._last_headers = list(headers)
+            
+            # 已有单元格直接更新文本，只为新增的位置创建 QTableWidgetItem
+            for i, row_texts in enumerate(texts):
+                for j, text in enumerate(row_texts):
+                    item = self.table.item(i, j)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        item.setTextAlignment(align)
+                        self.table.setItem(i, j, item)
+                    else:
+                        item.setText(text)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        
+        self._data_edited = False
+        self.on_selection_changed()
         self.label_info.setText(f"数据: {rows} 行 × {cols} 列")
-        self.auto_resize_columns()
+        # resizeColumnsToContents 要测量每个单元格，只在布局变化时执行
+        if shape_changed or headers_changed:
+            self.auto_resize_columns()
     
     def auto_resize_columns(self):
         """自动调整列宽"""
@@ -266,31 +324,41 @@ class TableViewDemo(QMainWindow):
         if self.data is None:
             return
         
+        self._highlighted = True
+        
+        # 沿 axis=0 一次求出每列最大/最小值所在的行
+        max_rows = self.data.argmax(axis=0).tolist()
+        min_rows = self.data.argmin(axis=0).tolist()
+        
+        # 颜色变化也会触发 itemChanged，高亮期间屏蔽信号，避免被视为数据编辑
+        self.table.blockSignals(True)
         for j in range(self.table.columnCount()):
-            col_data = self.data[:, j]
-            max_idx = np.argmax(col_data)
-            min_idx = np.argmin(col_data)
-            
             # 高亮最大值（红色）
-            max_item = self.table.item(max_idx, j)
+            max_item = self.table.item(max_rows[j], j)
             if max_item:
-                max_item.setBackground(QBrush(QColor("#ffcccc")))
-                max_item.setForeground(QBrush(QColor("#c0392b")))
+                max_item.setBackground(_MAX_BG)
+                max_item.setForeground(_MAX_FG)
             
             # 高亮最小值（蓝色）
-            min_item = self.table.item(min_idx, j)
+            min_item = self.table.item(min_rows[j], j)
             if min_item:
-                min_item.setBackground(QBrush(QColor("#cce5ff")))
-                min_item.setForeground(QBrush(QColor("#2980b9")))
+                min_item.setBackground(_MIN_BG)
+                min_item.setForeground(_MIN_FG)
+        self.table.blockSignals(False)
     
     def clear_highlight(self):
         """清除高亮"""
+        if not self._highlighted:
+            return  # 没有高亮时无需遍历全部单元格
+        self._highlighted = False
+        self.table.blockSignals(True)
         for i in range(self.table.rowCount()):
             for j in range(self.table.columnCount()):
                 item = self.table.item(i, j)
                 if item:
-                    item.setBackground(QBrush(QColor("white")))
-                    item.setForeground(QBrush(QColor("black")))
+                    item.setBackground(_WHITE_BRUSH)
+                    item.setForeground(_BLACK_BRUSH)
+        self.table.blockSignals(False)
     
     def add_row(self):
         """添加行"""
@@ -302,6 +370,7 @@ class TableViewDemo(QMainWindow):
             item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             self.table.setItem(row_count, j, item)
         
+        self._data_edited = True
         self.label_info.setText(f"数据: {self.table.rowCount()} 行 × {self.table.columnCount()} 列")
     
     def delete_selected_rows(self):
@@ -312,12 +381,19 @@ class TableViewDemo(QMainWindow):
         
         for row in sorted(selected_rows, reverse=True):
             self.table.removeRow(row)
+        if selected_rows:
+            self._data_edited = True
         
         self.label_info.setText(f"数据: {self.table.rowCount()} 行 × {self.table.columnCount()} 列")
     
     def sort_by_first_column(self):
         """按第一列排序"""
         self.table.sortItems(0, Qt.SortOrder.AscendingOrder)
+        self._data_edited = True
+    
+    def on_item_changed(self, item: QTableWidgetItem):
+        """单元格被编辑后，表格内容不再与 self.data 一致"""
+        self._data_edited = True
     
     def on_selection_changed(self):
         """选择变化时更新信息"""
@@ -353,9 +429,16 @@ class TableViewDemo(QMainWindow):
         
         if filename:
             try:
-                self.data = np.loadtxt(filename, delimiter=',', skiprows=1)
-                cols = self.data.shape[1]
-                headers = [f"列{i+1}" for i in range(cols)]
+                if PANDAS_AVAILABLE:
+                    df = pd.read_csv(filename, engine='c')
+                    if df.empty:
+                        raise ValueError("文件中没有数据")
+                    self.data = df.to_numpy(dtype=np.float64)
+                    headers = [str(c) for c in df.columns]
+                else:
+                    self.data = np.loadtxt(filename, delimiter=',', skiprows=1)
+                    cols = self.data.shape[1]
+                    headers = [f"列{i+1}" for i in range(cols)]
                 self.load_data_to_table(self.data, headers)
                 
             except Exception as e:
@@ -378,18 +461,30 @@ class TableViewDemo(QMainWindow):
                     header = self.table.horizontalHeaderItem(j)
                     headers.append(header.text() if header else f"列{j+1}")
                 
-                # 获取数据
-                data = []
-                for i in range(rows):
-                    row_data = []
+                # 获取数据：表格未被编辑时直接使用 self.data，
+                # 否则从表格按列读取，每列存为连续数组
+                if self.data is not None and not self._data_edited:
+                    columns = np.ascontiguousarray(self.data.T)
+                else:
+                    columns = np.empty((cols, rows))
                     for j in range(cols):
-                        item = self.table.item(i, j)
-                        row_data.append(float(item.text()) if item else 0)
-                    data.append(row_data)
+                        column = []
+                        for i in range(rows):
+                            item = self.table.item(i, j)
+                            column.append(float(item.text()) if item else 0.0)
+                        columns[j] = column
                 
-                data = np.array(data)
-                np.savetxt(filename, data, delimiter=',', 
-                          header=','.join(headers), comments='')
+                if PYARROW_AVAILABLE:
+                    # 表头自行写入（pyarrow默认会给列名加引号），与 np.savetxt 的输出一致
+                    table = pa.Table.from_arrays(
+                        [pa.array(col) for col in columns], names=headers)
+                    with open(filename, 'wb') as f:
+                        f.write((','.join(headers) + '\n').encode('utf-8'))
+                        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(
+                            include_header=False))
+                else:
+                    np.savetxt(filename, columns.T, delimiter=',',
+                              header=','.join(headers), comments='')
                 
                 QMessageBox.information(self, "导出成功", f"已导出到:\n{filename}")
                 
@@ -15,6 +15,7 @@
 import sys
 import time
 import numpy as np
+from scipy.fft import rfft
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QProgressBar, QTextEdit, QGroupBox,
@@ -62,16 +63,23 @@ class DataProcessingWorker(QThread):
             
             results = []
             
+            # 数据在迭代中不变，频谱幅值均值只需计算一次。
+            # 实数输入用 rfft 只算一半频谱，再按共轭对称性还原完整 FFT 的均值：
+            # 除直流项（及偶数长度时的奈奎斯特项）外，每个频点在完整频谱中出现两次
+            n = data.size
+            # scipy.fft 的实数FFT支持多线程（workers=-1 使用全部核心）
+            amplitude = np.abs(rfft(data, workers=-1))
+            total = 2.0 * amplitude.sum() - amplitude[0]
+            if n % 2 == 0:
+                total -= amplitude[-1]
+            result = total / n
+            
             # 模拟耗时计算
             for i in range(self.iterations):
                 if self._is_cancelled:
                     self.progress.emit(0, "任务已取消")
                     return
                 
-                # 模拟复杂计算
-                processed = np.fft.fft(data)
-                processed = np.abs(processed)
-                result = np.mean(processed)
                 results.append(result)
                 
                 # 更新进度
@@ -117,35 +125,52 @@ class SimulationWorker(QThread):
     step_result = pyqtSignal(int, float)  # 步数, 结果
     finished = pyqtSignal(list)
     
+    CHUNK = 50  # 每次整块计算的步数
+    
     def __init__(self, n_steps: int, n_particles: int):
         super().__init__()
         self.n_steps = n_steps
         self.n_particles = n_particles
         self._is_running = True
+        self._rng = np.random.default_rng()
     
     def run(self):
         """随机游走模拟"""
-        positions = np.zeros(self.n_particles)
+        positions = np.zeros(self.n_particles, dtype=np.int32)
         history = []
         
-        for step in range(self.n_steps):
+        # 每次整块生成 CHUNK 步：一次抽样 + 一次累加求出整段轨迹，
+        # 逐步循环只负责发送信号；分块使取消响应和内存占用都有上限
+        for start in range(0, self.n_steps, self.CHUNK):
             if not self._is_running:
                 break
             
-            # 随机游走步进
-            moves = np.random.choice([-1, 1], size=self.n_particles)
-            positions += moves
+            n = min(self.CHUNK, self.n_steps - start)
             
-            # 计算均方位移
-            msd = np.mean(positions**2)
-            history.append(msd)
+            # 随机游走步进：抽取 {0, 1} 整数再映射为 ±1
+            steps = self._rng.integers(0, 2, (n, self.n_particles), dtype=np.int8)
+            steps += steps - 1
+            trajectory = np.cumsum(steps, axis=0, dtype=np.int32)
+            trajectory += positions
+            positions = trajectory[-1]
             
-            # 发送进度和结果
-            progress = int((step + 1) / self.n_steps * 100)
-            self.progress.emit(progress)
-            self.step_result.emit(step, msd)
+            # 各步的均方位移（按行求平方和，以双精度累加）
+            msd_chunk = np.einsum('ij,ij->i', trajectory, trajectory,
+                                  dtype=np.float64) / self.n_particles
             
-            time.sleep(0.02)  # 控制速度
+            for k, msd in enumerate(msd_chunk.tolist()):
+                if not self._is_running:
+                    break
+                
+                step = start + k
+                history.append(msd)
+                
+                # 发送进度和结果
+                progress = int((step + 1) / self.n_steps * 100)
+                self.progress.emit(progress)
+                self.step_result.emit(step, msd)
+                
+                time.sleep(0.02)  # 控制速度
         
         self.finished.emit(history)
     
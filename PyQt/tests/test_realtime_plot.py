@@ -0,0 +1,67 @@
+"""
+realtime_plot.py 环形缓冲区的测试
+
+运行方式：
+    python -m pytest tests
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PyQt6.QtWidgets")
+pytest.importorskip("matplotlib")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ch04_plotting"))
+from realtime_plot import RealtimePlotWindow  # noqa: E402
+
+
+def make_buffer(max_points: int) -> SimpleNamespace:
+    """只包含 append_samples 用到的缓冲区状态，无需创建窗口"""
+    return SimpleNamespace(
+        max_points=max_points,
+        time_buf=np.empty(max_points),
+        value_buf=np.empty(max_points),
+        head=0,
+        filled=0,
+        v_min=np.inf,
+        v_max=-np.inf,
+        v_range_stale=False,
+    )
+
+
+def append(buf, values):
+    values = np.asarray(values, dtype=float)
+    RealtimePlotWindow.append_samples(buf, np.arange(values.size, dtype=float), values)
+
+
+def test_partly_full_to_full_evicts_extreme():
+    """一批数据使缓冲区从未满变为已满时，被覆盖的极值应使范围失效"""
+    buf = make_buffer(10)
+    append(buf, [6, 6, 100, 6, 6, 6, 6, 1])
+    assert not buf.v_range_stale
+
+    # 前两个点写入空槽，后三个点覆盖索引 0..2（其中包括最大值 100）
+    append(buf, [6] * 5)
+    assert buf.filled == 10
+    assert buf.v_range_stale
+
+
+def test_partly_full_to_full_keeps_range():
+    """被覆盖的点不是极值时，范围保持有效"""
+    buf = make_buffer(10)
+    append(buf, [6, 6, 6, 100, 6, 6, 6, 1])
+    append(buf, [6] * 5)
+    assert not buf.v_range_stale
+    assert (buf.v_min, buf.v_max) == (1, 100)
+
+
+def test_full_buffer_evicts_extreme():
+    """缓冲区已满时，覆盖最旧的极值同样使范围失效"""
+    buf = make_buffer(4)
+    append(buf, [100, 5, 5, 5])
+    append(buf, [5])
+    assert buf.v_range_stale